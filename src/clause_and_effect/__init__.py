@@ -10,13 +10,26 @@ __author__ = "Bertan Günyel"
 
 
 from .agents import *
+from .evaluation import *
 from .parsers import *
+from .profiling import *
 from .retrieval import *
+from .service import *
 
 
 __all__ = [
+    "ArticleIndex",
+    "Chunk",
+    "ChunkStore",
     "ComplianceAgent",
+    "ComplianceService",
     "EmbeddingGenerator",
+    "EvaluationRunner",
     "GDPRParser",
+    "IngestionProfiler",
+    "NearDuplicateDetector",
+    "ServiceClosedError",
+    "ServiceOverloadedError",
+    "SnapshotBundle",
     "VectorDatabase",
 ]
\ No newline at end of file
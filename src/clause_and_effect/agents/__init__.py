@@ -1,5 +1,8 @@
 from .compliance_agent import ComplianceAgent
+from .query_router import QueryRouter, RouteDecision
 
 __all__ = [
-    'ComplianceAgent'
+    'ComplianceAgent',
+    'QueryRouter',
+    'RouteDecision',
 ]
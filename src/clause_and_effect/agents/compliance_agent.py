@@ -1,18 +1,31 @@
 """
 Complete RAG system - putting it all together
 """
-from typing import Dict, Any
+from dataclasses import asdict
+import copy
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
 import time
 
 from pydantic import SecretStr
 
 from ai_common import calculate_token_cost, get_llm
-from src.clause_and_effect.generators import Generator
-from src.clause_and_effect.retrieval import VectorDatabase
+from src.clause_and_effect.agents.query_router import QueryRouter, RouteDecision
+from src.clause_and_effect.generators import Generator, SemanticCache
+from src.clause_and_effect.parsers import ArticleIndex
+from src.clause_and_effect.retrieval import ChunkStore, QueryExpander, VectorDatabase
 
 
 class ComplianceAgent:
 
+    RETRIEVAL_MODES = ("flat", "hierarchical", "multi_query")
+
+    # Which llm_config entry answers each route
+    ROUTE_MODELS = {
+        QueryRouter.SIMPLE: "language_model",
+        QueryRouter.COMPLEX: "reasoning_model",
+    }
+
     def __init__(self,
                  llm_config: dict[str, Any],
                  vector_db_url: SecretStr,
@@ -20,7 +33,24 @@ class ComplianceAgent:
                  vector_db_api_key: SecretStr,
                  collection_name: str,
                  embedding_model: str,
-                 embedding_model_api_key: SecretStr):
+                 embedding_model_api_key: SecretStr,
+                 semantic_cache_threshold: float | None = None,
+                 semantic_cache_size: int = 1024,
+                 chunk_store_dir: Path | None = None,
+                 article_index_path: Path | None = None,
+                 retrieval_mode: str = "flat",
+                 hierarchical_max_chars: int = 4000,
+                 enable_routing: bool = True,
+                 query_expansion_llm: bool = False,
+                 multi_query_variants: int = 4,
+                 sharded: bool = False):
+        if retrieval_mode not in self.RETRIEVAL_MODES:
+            raise ValueError(f"retrieval_mode must be one of {self.RETRIEVAL_MODES}, got '{retrieval_mode}'")
+        if retrieval_mode == "hierarchical" and article_index_path is None:
+            raise ValueError("Hierarchical retrieval requires article_index_path")
+
+        self.retrieval_mode = retrieval_mode
+        self.hierarchical_max_chars = hierarchical_max_chars
         self.models = list({*[v['model'] for k, v in llm_config.items()]})
 
         self.vector_db = VectorDatabase(
@@ -30,51 +60,231 @@ class ComplianceAgent:
             collection_name=collection_name,
             embedding_model=embedding_model,
             embedding_model_api_key=embedding_model_api_key,
+            chunk_store=ChunkStore(chunk_store_dir) if chunk_store_dir is not None else None,
+            article_index=ArticleIndex.load(article_index_path) if article_index_path is not None else None,
+            sharded=sharded,
         )
-        self.generator = Generator(model_params=llm_config['reasoning_model'])
+        self.generators = {key: Generator(model_params=llm_config[key]) for key in set(self.ROUTE_MODELS.values())}
+        self.generator = self.generators['reasoning_model']
+        self.router = QueryRouter() if enable_routing else None
 
+        self.query_expander = None
+        if retrieval_mode == "multi_query":
+            self.query_expander = QueryExpander(
+                llm_params=llm_config['language_model'] if query_expansion_llm else None,
+                max_variants=multi_query_variants,
+            )
+
+        # Paraphrase-tolerant answer caches, one per generator so a route never
+        # serves another model's answer; disabled when no threshold is given
+        self.semantic_caches: Dict[str, SemanticCache] = {}
+        if semantic_cache_threshold is not None:
+            self.semantic_caches = {
+                key: SemanticCache(similarity_threshold=semantic_cache_threshold, max_entries=semantic_cache_size)
+                for key in self.generators
+            }
 
-    def ask(self, query: str, top_k: int = 3) -> Dict[str, Any]:
+    def ask(self,
+            query: str,
+            top_k: int = 3,
+            regulations: List[str] | None = None,
+            jurisdictions: List[str] | None = None) -> Dict[str, Any]:
         """
         Ask a compliance question
 
         Args:
             query: User's question
             top_k: Number of chunks to retrieve
+            regulations: Only retrieve from these regulations (e.g. ["GDPR"])
+            jurisdictions: Only retrieve from these jurisdictions (e.g. ["EU"])
 
         Returns:
             Dict with answer, citations, and metadata
         """
         start_time = time.time()
 
-        # Retrieve relevant chunks
-        results = self.vector_db.search(query=query, top_k=top_k)
+        # Explicit article references are answered straight from the article index
+        decision, response = self.resolve_lookup(self.route(query),
+                                                 regulations=regulations,
+                                                 jurisdictions=jurisdictions)
+        if response is not None:
+            response["routing"] = self._routing_info(decision, model=None)
+            response["retrieval_time"] = time.time() - start_time
+            response["chunks_retrieved"] = len(response["raw_chunks"])
+            return response
+
+        model_key = self.ROUTE_MODELS[decision.route]
+        generator = self.generators[model_key]
+        semantic_cache = self.semantic_caches.get(model_key)
+
+        # Retrieve relevant chunks; the query embedding is reused by the semantic cache
+        query_embedding, results = self._retrieve(query=query,
+                                                  top_k=top_k,
+                                                  regulations=regulations,
+                                                  jurisdictions=jurisdictions)
 
         if not results:
             return {
                 "answer": "I couldn't find relevant information in the regulations to answer this question.",
                 "citations": [],
+                "routing": self._routing_info(decision, model=None),
                 "retrieval_time": time.time() - start_time,
                 "chunks_retrieved": 0
             }
 
-        # Generate answer
-        response = self.generator.generate(question=query, scored_points=results)
+        # Expanded (hierarchical) results are identified by the paragraphs they matched
+        chunk_ids = [cid for r in results for cid in r["metadata"].get("matched_chunk_ids", [r["chunk_id"]])]
+
+        # Serve paraphrases of already-answered questions from the cache, but
+        # only when they were grounded on exactly the same chunks of the same index
+        cached = None
+        if semantic_cache is not None:
+            index_version = self.vector_db.index_version
+            cached = semantic_cache.lookup(query_embedding=query_embedding,
+                                           chunk_ids=chunk_ids,
+                                           index_version=index_version)
+
+        if cached is not None:
+            # Cached responses are shared between hits; callers get their own copy
+            response = {**copy.deepcopy(cached), "cache_hit": True}
+        else:
+            # Generate answer
+            answer = asdict(generator.generate(question=query, scored_points=results))
 
-        # Add timing and retrieval info
+            if semantic_cache is not None:
+                semantic_cache.store(query=query,
+                                     query_embedding=query_embedding,
+                                     chunk_ids=chunk_ids,
+                                     index_version=index_version,
+                                     response=copy.deepcopy(answer))
+            response = {**answer, "cache_hit": False}
+
+        # Add routing, timing and retrieval info
+        response["routing"] = self._routing_info(decision, model=response["model"])
         response["retrieval_time"] = time.time() - start_time
         response["chunks_retrieved"] = len(results)
         response["retrieval_scores"] = [r["score"] for r in results]
 
         return response
 
+    def route(self, query: str) -> RouteDecision:
+        """Routing decision for a query (everything is "complex" when routing is off)"""
+        if self.router is not None:
+            return self.router.route(query)
+        return RouteDecision(route=QueryRouter.COMPLEX, reason="routing disabled")
+
+    def resolve_lookup(self,
+                       decision: RouteDecision,
+                       regulations: List[str] | None = None,
+                       jurisdictions: List[str] | None = None) -> Tuple[RouteDecision, Dict[str, Any] | None]:
+        """
+        Answer a direct lookup from the article index
+
+        Args:
+            decision: Routing decision for the query
+            regulations: Only quote articles of these regulations
+            jurisdictions: Only quote articles of these jurisdictions
+
+        Returns:
+            (decision, response): the lookup response for an answerable lookup; otherwise
+            no response, and a lookup that cannot be answered is downgraded to "simple"
+        """
+        if decision.route != QueryRouter.DIRECT_LOOKUP:
+            return decision, None
+
+        response = self._answer_lookup(decision, regulations=regulations, jurisdictions=jurisdictions)
+        if response is not None:
+            return decision, response
+
+        return RouteDecision(route=QueryRouter.SIMPLE,
+                             reason="referenced article not in index or filtered out",
+                             article_refs=decision.article_refs), None
+
+    def retrieve(self,
+                 query: str,
+                 top_k: int = 3,
+                 regulations: List[str] | None = None,
+                 jurisdictions: List[str] | None = None) -> List[Dict[str, Any]]:
+        """Run only the retrieval stage of ``ask``"""
+        _, results = self._retrieve(query=query, top_k=top_k, regulations=regulations, jurisdictions=jurisdictions)
+        return results
+
+    def _answer_lookup(self,
+                       decision: RouteDecision,
+                       regulations: List[str] | None = None,
+                       jurisdictions: List[str] | None = None) -> Dict[str, Any] | None:
+        """Quote the referenced article without calling a model; None if it is not indexed or filtered out"""
+        if self.vector_db.article_index is None:
+            return None
+
+        wanted_regulations = VectorDatabase.normalise_filter(regulations) if regulations else None
+        wanted_jurisdictions = VectorDatabase.normalise_filter(jurisdictions) if jurisdictions else None
+
+        regulation, article_number, paragraph = decision.article_refs[0]
+        if regulation is None and wanted_regulations is not None and len(wanted_regulations) == 1:
+            regulation = wanted_regulations[0]
+
+        chunk = self.vector_db.article_index.lookup(article_number=article_number,
+                                                    regulation=regulation,
+                                                    paragraph=paragraph)
+        if chunk is None:
+            return None
+
+        # Same filter semantics as retrieval
+        if wanted_regulations is not None and chunk.metadata.get("regulation", "").upper() not in wanted_regulations:
+            return None
+        if wanted_jurisdictions is not None and chunk.metadata.get("jurisdiction", "").upper() not in wanted_jurisdictions:
+            return None
+
+        return {
+            "answer": chunk.text,
+            "citations": [f"{chunk.metadata.get('regulation', regulation or '')} Article {article_number}".strip()],
+            "raw_chunks": [{"chunk_id": chunk.id, "text": chunk.text, "metadata": copy.deepcopy(chunk.metadata), "score": 1.0}],
+            "model": None,
+            "total_tokens": 0,
+            "cache_hit": False,
+        }
+
+    @staticmethod
+    def _routing_info(decision: RouteDecision, model: str | None) -> Dict[str, Any]:
+        return {"route": decision.route, "reason": decision.reason, "model": model}
+
+    def _retrieve(self,
+                  query: str,
+                  top_k: int,
+                  regulations: List[str] | None = None,
+                  jurisdictions: List[str] | None = None) -> Tuple[List[float], List[Dict[str, Any]]]:
+        """Run the configured retrieval mode, embedding the query exactly once"""
+        filters = {"regulations": regulations, "jurisdictions": jurisdictions}
+
+        if self.retrieval_mode == "multi_query":
+            # One batched embedding call and one batched Qdrant request for all variants
+            queries = self.query_expander.expand(query)
+            query_embeddings = self.vector_db.embedding_generator.embed_batch(batch=queries)
+            results = self.vector_db.search_multi(queries=queries,
+                                                  top_k=top_k,
+                                                  query_embeddings=query_embeddings,
+                                                  **filters)
+            return query_embeddings[0], results
+
+        query_embedding = self.vector_db.embedding_generator.embed_text(query)
+        if self.retrieval_mode == "hierarchical":
+            results = self.vector_db.search_hierarchical(query=query,
+                                                         top_k=top_k,
+                                                         query_embedding=query_embedding,
+                                                         max_chars=self.hierarchical_max_chars,
+                                                         **filters)
+        else:
+            results = self.vector_db.search(query=query, top_k=top_k, query_embedding=query_embedding, **filters)
+        return query_embedding, results
+
     def get_system_info(self) -> Dict[str, Any]:
         """Get information about the RAG system"""
         db_info = self.vector_db.get_collection_info()
 
         return {
             "vector_db": db_info,
-            "generator_model": self.generator.model,
+            "generator_models": {key: generator.model_name for key, generator in self.generators.items()},
             "embedding_model": self.vector_db.embedding_generator.model,
             "status": "ready" if db_info.get("points_count", 0) > 0 else "not_indexed"
         }
@@ -0,0 +1,84 @@
+"""
+Query routing by complexity
+
+Direct article lookups ("Show me GDPR Article 17") are answered from the
+article index without any model call, simple factual questions go to the
+cheaper language model, and only comparison / multi-article questions are
+sent to the reasoning model.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass
+class RouteDecision:
+    """Routing outcome reported back with every response."""
+    route:        str                  # "direct_lookup" | "simple" | "complex"
+    reason:       str
+    article_refs: List[Tuple[str | None, str, str | None]] = field(default_factory=list)  # (regulation, article, paragraph)
+
+
+class QueryRouter:
+    """Rule-based router: cheap, deterministic and explainable"""
+
+    DIRECT_LOOKUP = "direct_lookup"
+    SIMPLE = "simple"
+    COMPLEX = "complex"
+
+    # "GDPR Article 17", "Art. 17(3)", "article 6.1"
+    ARTICLE_PATTERN = re.compile(
+        r"(?:\b(GDPR|CCPA|PIPEDA)\s+)?\bArt(?:icle|\.)?\s*(\d+)(?:\s*\((\d+)\)|\.(\d+))?",
+        re.IGNORECASE,
+    )
+    REGULATION_PATTERN = re.compile(r"\b(GDPR|CCPA|CPRA|PIPEDA)\b", re.IGNORECASE)
+    # Words a pure lookup may contain besides the article reference
+    # ("Show me the full text of GDPR Article 17", "What does Art. 6 say?")
+    LOOKUP_WORDS = frozenset({
+        "show", "me", "display", "quote", "print", "give", "read", "text", "wording",
+        "full", "the", "of", "in", "please", "what", "does", "say", "says",
+    })
+    COMPLEX_MARKERS = (
+        "compare", "comparison", "versus", " vs", "differ", "difference",
+        "conflict", "both", "steps", "should we", "can we", "do we need",
+        "we want", "implications", "how does .* interact", "relationship between",
+    )
+    MAX_SIMPLE_WORDS = 25
+
+    def route(self, query: str) -> RouteDecision:
+        """
+        Classify a query
+
+        Args:
+            query: User's question
+
+        Returns:
+            RouteDecision with the chosen route and why
+        """
+        refs = [
+            (regulation.upper() if regulation else None, article, paragraph or sub_paragraph or None)
+            for regulation, article, paragraph, sub_paragraph in self.ARTICLE_PATTERN.findall(query)
+        ]
+        regulations = {r.upper() for r in self.REGULATION_PATTERN.findall(query)}
+        query_lower = query.lower()
+
+        if len(refs) == 1 and self._is_lookup(query):
+            return RouteDecision(route=self.DIRECT_LOOKUP, reason="explicit article reference", article_refs=refs)
+
+        if len(refs) > 1:
+            return RouteDecision(route=self.COMPLEX, reason="multiple article references", article_refs=refs)
+        if len(regulations) > 1:
+            return RouteDecision(route=self.COMPLEX, reason="multiple regulations", article_refs=refs)
+
+        marker = next((m for m in self.COMPLEX_MARKERS if re.search(m, query_lower)), None)
+        if marker is not None:
+            return RouteDecision(route=self.COMPLEX, reason=f"complexity marker '{marker.strip()}'", article_refs=refs)
+        if len(query.split()) > self.MAX_SIMPLE_WORDS:
+            return RouteDecision(route=self.COMPLEX, reason="long query", article_refs=refs)
+
+        return RouteDecision(route=self.SIMPLE, reason="single factual question", article_refs=refs)
+
+    def _is_lookup(self, query: str) -> bool:
+        """Nothing left besides lookup verbs and the reference itself"""
+        remainder = self.REGULATION_PATTERN.sub(" ", self.ARTICLE_PATTERN.sub(" ", query))
+        return all(word in self.LOOKUP_WORDS for word in re.findall(r"\w+", remainder.lower()))
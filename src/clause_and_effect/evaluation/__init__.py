@@ -0,0 +1,6 @@
+from .evaluation_runner import EvaluationRunner, TestCase
+
+__all__ = [
+    'EvaluationRunner',
+    'TestCase',
+]
@@ -0,0 +1,247 @@
+"""
+Parallel, cached evaluation over the test cases in TEST_CASES_DIR
+
+Test case files are JSON (a list of cases or a single case) or JSONL:
+
+    {"id": "erasure-01",
+     "question": "How fast must we answer an erasure request?",
+     "expected_articles": ["GDPR Article 12", "GDPR Article 17"],
+     "regulations": ["GDPR"]}            # optional retrieval filter
+
+Retrieval results are cached per (case, index version, retrieval config)
+and generations per (rendered prompt, model config). The rendered prompt
+covers the prompt templates, the context formatting and the retrieved
+chunks, so a prompt change re-runs generation but not retrieval, and a
+retrieval change re-runs the LLM for the affected cases only.
+
+Cache entries keep the seconds the stage originally took, so reported
+latencies stay comparable between cold and warm runs. A case that raises
+is recorded with its error instead of aborting the run.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.clause_and_effect.agents import ComplianceAgent
+from src.clause_and_effect.generators import Generator
+from src.clause_and_effect.evaluation.metrics import (citation_scores, normalize_citation, percentile,
+                                                      recall_at_k, reciprocal_rank, retrieved_articles)
+
+
+@dataclass
+class TestCase:
+    """One evaluation question and its ground truth."""
+    id:                str
+    question:          str
+    expected_articles: List[str]
+    regulations:       List[str] | None = None
+    jurisdictions:     List[str] | None = None
+    metadata:          Dict[str, Any] = field(default_factory=dict)
+
+
+class EvaluationRunner:
+    """Runs test cases through a ComplianceAgent with bounded parallelism and stage caching"""
+
+    def __init__(self, agent: ComplianceAgent, cache_dir: Path, max_workers: int = 8, top_k: int = 5):
+        """
+        Args:
+            agent:       Agent under evaluation
+            cache_dir:   Directory for the retrieval and generation caches
+            max_workers: Cases evaluated concurrently
+            top_k:       Retrieval depth (recall is reported at this k)
+        """
+        self.agent = agent
+        self.cache_dir = Path(cache_dir)
+        self.max_workers = max_workers
+        self.top_k = top_k
+
+    @staticmethod
+    def load_test_cases(test_cases_dir: Path) -> List[TestCase]:
+        """Read every *.json / *.jsonl test case file in a directory"""
+        cases = []
+        for path in sorted(Path(test_cases_dir).glob("*.json*")):
+            if path.suffix == ".jsonl":
+                records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+            else:
+                records = json.loads(path.read_text(encoding="utf-8"))
+                records = records if isinstance(records, list) else [records]
+
+            for i, record in enumerate(records):
+                expected = [normalize_citation(a) for a in record.get("expected_articles", [])]
+                cases.append(TestCase(
+                    id=str(record.get("id", f"{path.stem}-{i}")),
+                    question=record["question"],
+                    expected_articles=[a for a in expected if a is not None],
+                    regulations=record.get("regulations"),
+                    jurisdictions=record.get("jurisdictions"),
+                    metadata={k: v for k, v in record.items()
+                              if k not in ("id", "question", "expected_articles", "regulations", "jurisdictions")},
+                ))
+
+        print(f"✅ Loaded {len(cases)} test cases from {test_cases_dir}")
+        return cases
+
+    def run(self, cases: List[TestCase]) -> Dict[str, Any]:
+        """
+        Evaluate test cases concurrently
+
+        Args:
+            cases: Test cases to run
+
+        Returns:
+            Report with aggregate metrics and per-case results
+        """
+        # Another process may have re-indexed since the agent started
+        index_version = self.agent.vector_db.refresh_index_version()
+        print(f"🧪 Evaluating {len(cases)} cases against index {index_version} ({self.max_workers} workers)")
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda case: self._evaluate_case_safe(case, index_version), cases))
+
+        return {
+            "index_version": index_version,
+            "top_k": self.top_k,
+            "wall_time": time.time() - start_time,
+            "summary": self._summarize(results),
+            "cases": results,
+        }
+
+    # ------------------------------------------------------------------ #
+    #  Private helpers                                                     #
+    # ------------------------------------------------------------------ #
+
+    def _evaluate_case_safe(self, case: TestCase, index_version: str | None) -> Dict[str, Any]:
+        """``_evaluate_case``, with a failure recorded in the result instead of raised"""
+        try:
+            return self._evaluate_case(case, index_version)
+        except Exception as e:
+            print(f"❌ Case {case.id} failed: {type(e).__name__}: {e}")
+            return {"id": case.id, "question": case.question, "error": f"{type(e).__name__}: {e}"}
+
+    def _evaluate_case(self, case: TestCase, index_version: str | None) -> Dict[str, Any]:
+        start_time = time.time()
+        decision, response = self.agent.resolve_lookup(self.agent.route(case.question),
+                                                       regulations=case.regulations,
+                                                       jurisdictions=case.jurisdictions)
+        routing_seconds = time.time() - start_time
+
+        if response is not None:
+            # Quoted from the article index: no model call, cheap enough to run uncached.
+            # Lookups the index cannot answer were downgraded and take the cached path below
+            results = response["raw_chunks"]
+            timings = {"routing": routing_seconds, "retrieval": 0.0, "generation": 0.0}
+            cache = {"retrieval": False, "generation": False}
+        else:
+            retrieval_key = self._key("retrieval", case.id, case.question, case.regulations,
+                                      case.jurisdictions, index_version, self._retrieval_config())
+            results, timings_retrieval, retrieval_hit = self._cached(
+                "retrieval", retrieval_key,
+                lambda: self.agent.retrieve(query=case.question, top_k=self.top_k,
+                                            regulations=case.regulations, jurisdictions=case.jurisdictions),
+            )
+
+            generator = self.agent.generators[self.agent.ROUTE_MODELS[decision.route]]
+            messages = generator.build_messages(question=case.question, scored_points=results) if results else None
+            generation_key = self._key("generation", case.id, case.question, messages,
+                                       generator.model_name, generator.model_args)
+            response, timings_generation, generation_hit = self._cached(
+                "generation", generation_key,
+                lambda: self._generate(generator, case.question, results),
+            )
+            timings = {"routing": routing_seconds, "retrieval": timings_retrieval, "generation": timings_generation}
+            cache = {"retrieval": retrieval_hit, "generation": generation_hit}
+
+        articles = retrieved_articles(results)
+        return {
+            "id": case.id,
+            "question": case.question,
+            "route": decision.route,
+            "expected_articles": case.expected_articles,
+            "retrieved_articles": articles,
+            "citations": response.get("citations", []),
+            "recall_at_k": recall_at_k(articles, case.expected_articles, self.top_k),
+            "reciprocal_rank": reciprocal_rank(articles, case.expected_articles),
+            "citation": citation_scores(response.get("citations", []), case.expected_articles),
+            # Stage seconds are compute times (from the cache entry on a hit); "wall" is this run
+            "latency": {**timings, "total": sum(timings.values()), "wall": time.time() - start_time},
+            "cache": cache,
+        }
+
+    @staticmethod
+    def _generate(generator: Generator, question: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if not results:
+            # Mirrors ComplianceAgent.ask: nothing retrieved, nothing to ground an answer on
+            return {"answer": "", "citations": [], "model": generator.model_name}
+        return asdict(generator.generate(question=question, scored_points=results))
+
+    def _cached(self, stage: str, key: str, compute: Callable[[], Any]) -> Tuple[Any, float, bool]:
+        """
+        (value, seconds, cache_hit) for a stage, computing and storing it on a miss
+
+        ``seconds`` is the time the stage took when it was computed, also on a hit.
+        """
+        path = self.cache_dir / stage / f"{key}.json"
+        if path.exists():
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            # Entries written before compute times were stored are recomputed
+            if isinstance(entry, dict) and entry.keys() == {"value", "seconds"}:
+                return entry["value"], entry["seconds"], True
+
+        start_time = time.time()
+        value = compute()
+        elapsed = time.time() - start_time
+
+        # Write-then-rename so concurrent workers never read a partial file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps({"value": value, "seconds": elapsed}, ensure_ascii=False, default=str),
+                            encoding="utf-8")
+        os.replace(tmp_path, path)
+        return value, elapsed, False
+
+    def _retrieval_config(self) -> Dict[str, Any]:
+        expander = self.agent.query_expander
+        return {
+            "top_k": self.top_k,
+            "mode": self.agent.retrieval_mode,
+            "hierarchical_max_chars": self.agent.hierarchical_max_chars,
+            "multi_query_variants": expander.max_variants if expander is not None else None,
+            "query_expansion_llm": expander is not None and expander.llm is not None,
+            "embedding_model": self.agent.vector_db.embedding_generator.model,
+        }
+
+    @staticmethod
+    def _key(*parts: Any) -> str:
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:24]
+
+    @staticmethod
+    def _summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        def mean(values: List[float]) -> float | None:
+            return sum(values) / len(values) if values else None
+
+        # Metrics cover the cases that completed; failures are only counted
+        errors = sum("error" in r for r in results)
+        results = [r for r in results if "error" not in r]
+
+        total_latencies = [r["latency"]["total"] for r in results]
+        return {
+            "cases": len(results) + errors,
+            "errors": errors,
+            "recall_at_k": mean([r["recall_at_k"] for r in results]),
+            "mrr": mean([r["reciprocal_rank"] for r in results]),
+            "citation_precision": mean([r["citation"]["precision"] for r in results]),
+            "citation_recall": mean([r["citation"]["recall"] for r in results]),
+            "citation_f1": mean([r["citation"]["f1"] for r in results]),
+            "latency_p50": percentile(total_latencies, 50),
+            "latency_p95": percentile(total_latencies, 95),
+            "retrieval_cache_hits": sum(r["cache"]["retrieval"] for r in results),
+            "generation_cache_hits": sum(r["cache"]["generation"] for r in results),
+            "routes": {route: sum(r["route"] == route for r in results) for route in {r["route"] for r in results}},
+        }
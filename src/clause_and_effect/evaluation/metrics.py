@@ -0,0 +1,75 @@
+"""
+Retrieval and citation metrics, computed at article level
+"""
+import math
+import re
+from typing import Any, Dict, List
+
+CITATION_PATTERN = re.compile(r"\b(GDPR|CCPA|PIPEDA)\s+Art(?:icle|\.)?\s*(\d+)", re.IGNORECASE)
+
+
+def normalize_citation(citation: str) -> str | None:
+    """
+    Canonical article reference: "gdpr article 17.3" -> "GDPR Article 17"
+
+    Returns:
+        Normalized reference, or None if the text holds no "REGULATION Article N"
+    """
+    match = CITATION_PATTERN.search(citation)
+    if match is None:
+        return None
+    return f"{match.group(1).upper()} Article {int(match.group(2))}"
+
+
+def retrieved_articles(results: List[Dict[str, Any]]) -> List[str]:
+    """Ranked, de-duplicated article references covered by retrieval results"""
+    articles = []
+    for result in results:
+        metadata = result["metadata"]
+        # Collapsed near-duplicates cover every article they were merged from
+        sources = metadata.get("source_citations") or [metadata]
+        for source in sources:
+            article = f"{source.get('regulation', '')} Article {source.get('article_number', '')}"
+            article = normalize_citation(article)
+            if article is not None and article not in articles:
+                articles.append(article)
+    return articles
+
+
+def recall_at_k(retrieved: List[str], expected: List[str], k: int) -> float:
+    """Share of expected articles found in the first k retrieved"""
+    if not expected:
+        return 1.0
+    return len(set(retrieved[:k]) & set(expected)) / len(set(expected))
+
+
+def reciprocal_rank(retrieved: List[str], expected: List[str]) -> float:
+    """1 / rank of the first relevant article (0 when none is retrieved)"""
+    for rank, article in enumerate(retrieved, start=1):
+        if article in expected:
+            return 1.0 / rank
+    return 0.0
+
+
+def citation_scores(predicted: List[str], expected: List[str]) -> Dict[str, float]:
+    """Precision, recall and F1 of the answer's citations against the expected articles"""
+    predicted_set = {c for c in (normalize_citation(p) for p in predicted) if c is not None}
+    expected_set = set(expected)
+
+    if not predicted_set and not expected_set:
+        return {"precision": 1.0, "recall": 1.0, "f1": 1.0}
+
+    true_positives = len(predicted_set & expected_set)
+    precision = true_positives / len(predicted_set) if predicted_set else 0.0
+    recall = true_positives / len(expected_set) if expected_set else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
+
+
+def percentile(values: List[float], q: float) -> float | None:
+    """Nearest-rank percentile (q in [0, 100])"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
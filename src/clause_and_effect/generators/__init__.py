@@ -1,5 +1,7 @@
 from .generator import Generator
+from .semantic_cache import SemanticCache
 
 __all__ = [
-    'Generator'
+    'Generator',
+    'SemanticCache',
 ]
@@ -59,6 +59,7 @@ class Generator:
                                 api_key=model_params['api_key'],
                                 model_args=model_params['model_args'])
         self.model_name = model_params['model']
+        self.model_args = model_params['model_args']
 
 
     def generate(self,
@@ -77,15 +78,7 @@ class Generator:
         Returns:
             GeneratedAnswer with answer text, citations, and metadata
         """
-        context = self._format_context(scored_points)
-        query = QUERY_TEMPLATE.format(question=question, context=context)
-
-        response = self.base_llm.invoke(
-            input = [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user",   "content": query},
-            ],
-        )
+        response = self.base_llm.invoke(input=self.build_messages(question=question, scored_points=scored_points))
 
         answer_text  = response.content_blocks[-1]['text']
         total_tokens = 0
@@ -98,6 +91,16 @@ class Generator:
             total_tokens=total_tokens,
         )
 
+    def build_messages(self, question: str, scored_points: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Exact prompt sent to the model for a question and its retrieved chunks"""
+        context = self._format_context(scored_points)
+        query = QUERY_TEMPLATE.format(question=question, context=context)
+
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user",   "content": query},
+        ]
+
     # ------------------------------------------------------------------ #
     #  Private helpers                                                     #
     # ------------------------------------------------------------------ #
@@ -111,13 +114,19 @@ class Generator:
             title      = point['metadata'].get("article_title", "")
             text       = point.get("text", "")
             score      = point.get("score", "N/A")
-            parts.append(
-                f"[{i}] {regulation} Article {article}: {title} (relevance: {score:.2f})\n"
-                f"{text}\n"
-            )
+            header     = f"[{i}] {regulation} Article {article}: {title} (relevance: {score:.2f})"
+
+            # Collapsed near-duplicates: the same text is citable from every source
+            sources = point['metadata'].get("source_citations", [])
+            if len(sources) > 1:
+                also = ", ".join(f"{s['regulation']} Article {s['article_number']}" for s in sources[1:])
+                header += f" [same text also in: {also}]"
+
+            parts.append(f"{header}\n{text}\n")
         return "\n---\n".join(parts)
 
     @staticmethod
     def _extract_citations(answer_text: str) -> List[str]:
-        pattern = r"(GDPR|CCPA|PIPEDA)\s+Article\s+[\d\.]+"
+        # Non-capturing group: findall must return the whole "GDPR Article N" match
+        pattern = r"(?:GDPR|CCPA|PIPEDA)\s+Article\s+\d+(?:\.\d+)*"
         return list(dict.fromkeys(re.findall(pattern, answer_text, re.IGNORECASE)))
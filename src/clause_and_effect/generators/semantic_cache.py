@@ -0,0 +1,139 @@
+"""
+Semantic answer cache keyed by near-duplicate query embeddings.
+
+Paraphrased questions ("How fast must we delete data?" vs. "What is the
+deletion deadline?") miss an exact-match cache. This cache keeps a small
+in-memory matrix of normalised query embeddings and serves a stored answer
+when a new query is close enough (cosine similarity) AND was answered from
+the same retrieved chunks of the same index version.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import threading
+import time
+
+import numpy as np
+
+
+@dataclass
+class CacheEntry:
+    """A previously generated answer and the context it was grounded on."""
+    query:         str
+    chunk_ids:     List[str]
+    index_version: Optional[str]
+    response:      Dict[str, Any]
+    created_at:    float = field(default_factory=time.time)
+    hits:          int = 0
+
+
+class SemanticCache:
+    """Nearest-neighbour answer cache in front of ``Generator.generate``."""
+
+    def __init__(self, similarity_threshold: float = 0.95, max_entries: int = 1024):
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError(f"similarity_threshold must be in (0, 1], got {similarity_threshold}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.index_version: Optional[str] = None
+
+        self._entries: List[CacheEntry] = []
+        self._vectors: Optional[np.ndarray] = None  # (n_entries, dim), L2-normalised rows
+        self._lock = threading.Lock()  # shared by concurrent requests in a service process
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self,
+               query_embedding: List[float],
+               chunk_ids: List[str],
+               index_version: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a semantically equivalent query.
+
+        Args:
+            query_embedding: Embedding of the incoming query
+            chunk_ids:       IDs of the chunks retrieved for the incoming query
+            index_version:   Current ``VectorDatabase.index_version``
+
+        Returns:
+            The cached response dict, or None on a miss
+        """
+        with self._lock:
+            self._sync_index_version(index_version)
+            if not self._entries:
+                return None
+
+            similarities = self._vectors @ self._normalise(query_embedding)
+
+            # Best candidates first; the chunk-ID check may reject the top match
+            for idx in np.argsort(-similarities):
+                if similarities[idx] < self.similarity_threshold:
+                    break
+                entry = self._entries[idx]
+                if entry.chunk_ids == list(chunk_ids):
+                    entry.hits += 1
+                    return entry.response
+
+            return None
+
+    def store(self,
+              query: str,
+              query_embedding: List[float],
+              chunk_ids: List[str],
+              index_version: Optional[str],
+              response: Dict[str, Any]):
+        """
+        Store a freshly generated answer.
+
+        Args:
+            query:           Original query text
+            query_embedding: Embedding of the query
+            chunk_ids:       IDs of the chunks the answer was grounded on
+            index_version:   ``VectorDatabase.index_version`` used for retrieval
+            response:        Response dict to serve on future hits
+        """
+        with self._lock:
+            self._sync_index_version(index_version)
+
+            if len(self._entries) >= self.max_entries:
+                # Evict the oldest entry (FIFO keeps the vector matrix contiguous)
+                self._entries.pop(0)
+                self._vectors = self._vectors[1:]
+
+            vector = self._normalise(query_embedding)[np.newaxis, :]
+            self._vectors = vector if self._vectors is None else np.vstack([self._vectors, vector])
+            self._entries.append(CacheEntry(
+                query=query,
+                chunk_ids=list(chunk_ids),
+                index_version=index_version,
+                response=response,
+            ))
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._clear()
+
+    # ------------------------------------------------------------------ #
+    #  Private helpers                                                     #
+    # ------------------------------------------------------------------ #
+
+    def _sync_index_version(self, index_version: Optional[str]):
+        """Evict everything once the vector index has been rebuilt"""
+        if index_version != self.index_version:
+            self._clear()
+            self.index_version = index_version
+
+    def _clear(self):
+        self._entries = []
+        self._vectors = None
+
+    @staticmethod
+    def _normalise(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
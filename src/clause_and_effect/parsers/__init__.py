@@ -1,7 +1,12 @@
+from .article_index import ArticleIndex
 from .base_parser import Chunk
+from .deduplication import DedupReport, NearDuplicateDetector
 from .gdpr_parser import GDPRParser
 
 __all__ = [
+    "ArticleIndex",
     "Chunk",
-    "GDPRParser"
+    "DedupReport",
+    "GDPRParser",
+    "NearDuplicateDetector",
 ]
\ No newline at end of file
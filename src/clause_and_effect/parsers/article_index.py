@@ -0,0 +1,145 @@
+"""
+Article -> paragraph adjacency index, built from parsed chunks
+"""
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from .base_parser import Chunk
+
+
+class ArticleIndex:
+    """
+    Parent/child view over a chunk list
+
+    Long articles are split into paragraph chunks at parse time; this index
+    keeps the link from each article to its ordered paragraphs so retrieval
+    can expand a matched paragraph to its neighbours or the whole article.
+    """
+
+    def __init__(self, chunks: List[Chunk], index_version: str | None = None):
+        """
+        Args:
+            chunks:        Parsed chunks in document order
+            index_version: ``VectorDatabase.index_version`` of the collection built
+                           alongside this index, None when unknown
+        """
+        self.chunks: Dict[str, Chunk] = {chunk.id: chunk for chunk in chunks}
+        self.index_version = index_version
+        self.articles: Dict[str, List[str]] = {}
+
+        self._by_number: Dict[tuple, str] = {}  # (regulation, article_number) -> parent_id
+
+        # Chunks arrive in document order, so children are already ordered
+        for chunk in chunks:
+            parent_id = chunk.metadata.get("parent_id", chunk.id)
+            self.articles.setdefault(parent_id, []).append(chunk.id)
+            key = (chunk.metadata.get("regulation"), str(chunk.metadata.get("article_number")))
+            self._by_number.setdefault(key, parent_id)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def parent_of(self, chunk_id: str) -> str:
+        """Article ID a chunk belongs to"""
+        return self.chunks[chunk_id].metadata.get("parent_id", chunk_id)
+
+    def children(self, parent_id: str) -> List[str]:
+        """Ordered chunk IDs of an article"""
+        return self.articles.get(parent_id, [])
+
+    def neighbors(self, chunk_id: str, window: int = 1) -> List[str]:
+        """
+        Sibling chunks around a chunk, in document order
+
+        Args:
+            chunk_id: Chunk to expand
+            window:   Number of siblings to take on each side
+
+        Returns:
+            Chunk IDs from position - window to position + window (inclusive)
+        """
+        siblings = self.children(self.parent_of(chunk_id))
+        position = siblings.index(chunk_id)
+        return siblings[max(0, position - window):position + window + 1]
+
+    def article_text(self, parent_id: str, chunk_ids: List[str] | None = None) -> str:
+        """
+        Reassemble an article (or a subset of its paragraphs) into one text
+
+        Args:
+            parent_id: Article ID
+            chunk_ids: Paragraphs to include; all of them when None
+
+        Returns:
+            "Article N: Title" header followed by the paragraph bodies
+        """
+        siblings = self.children(parent_id)
+        if len(siblings) == 1:
+            return self.chunks[siblings[0]].text
+
+        wanted = set(chunk_ids) if chunk_ids is not None else set(siblings)
+        metadata = self.chunks[siblings[0]].metadata
+        header = f"Article {metadata['article_number']}: {metadata['article_title']}"
+
+        # Paragraph chunks are "Article N.i: Title\n\n<body>"; keep the body only
+        bodies = [self.chunks[cid].text.split("\n\n", 1)[-1] for cid in siblings if cid in wanted]
+        return "\n\n".join([header, *bodies])
+
+    def lookup(self,
+               article_number: str,
+               regulation: str | None = None,
+               paragraph: str | None = None) -> Chunk | None:
+        """
+        Find an article (or one of its paragraphs) by number
+
+        Args:
+            article_number: Article number, e.g. "17"
+            regulation:     Regulation name; any regulation when None
+            paragraph:      Paragraph number within the article
+
+        Returns:
+            Chunk holding the requested text, or None if not indexed or, without a
+            regulation, if several regulations have an article with that number
+        """
+        if regulation is not None:
+            parent_id = self._by_number.get((regulation.upper(), str(article_number)))
+        else:
+            matches = [pid for (_, number), pid in self._by_number.items() if number == str(article_number)]
+            # "Article 5" is ambiguous once more than one regulation is indexed
+            parent_id = matches[0] if len(matches) == 1 else None
+        if parent_id is None:
+            return None
+
+        siblings = self.children(parent_id)
+        if paragraph is not None:
+            for chunk_id in siblings:
+                if self.chunks[chunk_id].metadata.get("paragraph") == str(paragraph):
+                    return self.chunks[chunk_id]
+
+        # Whole article: single chunk as is, split articles reassembled
+        first = self.chunks[siblings[0]]
+        if len(siblings) == 1:
+            return first
+        metadata = {k: v for k, v in first.metadata.items()
+                    if k not in ("paragraph", "prev_chunk_id", "next_chunk_id")}
+        return Chunk(id=parent_id, text=self.article_text(parent_id), metadata={**metadata, "chunk_type": "article"})
+
+    def save(self, path: Path):
+        """Write the index (with chunk texts) as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        records = [{"id": c.id, "text": c.text, "metadata": c.metadata} for c in self.chunks.values()]
+        path.write_text(json.dumps({"index_version": self.index_version, "chunks": records}, ensure_ascii=False),
+                        encoding="utf-8")
+        print(f"✅ Saved article index ({len(self.articles)} articles) to {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> "ArticleIndex":
+        """Load an index written by ``save``"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if isinstance(data, list):
+            # Written before the index version was recorded
+            data = {"index_version": None, "chunks": data}
+        return cls([Chunk(id=r["id"], text=r["text"], metadata=r["metadata"]) for r in data["chunks"]],
+                   index_version=data["index_version"])
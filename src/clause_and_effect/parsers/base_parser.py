@@ -3,9 +3,12 @@ Base parser interface for regulation documents
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from ..profiling import IngestionProfiler
+
 
 @dataclass
 class Chunk:
@@ -21,16 +24,24 @@ class Chunk:
 class BaseParser(ABC):
     """Base class for regulation document parsers"""
 
+    # Bump whenever chunking or metadata output changes
+    VERSION = "1"
+
     def __init__(self, regulation_name: str):
         self.regulation_name = regulation_name
 
+    def fingerprint(self) -> str:
+        """Identifies the parser build that produced a set of chunks"""
+        return f"{type(self).__name__}:{self.VERSION}"
+
     @abstractmethod
-    def parse(self, file_path: Path) -> List[Chunk]:
+    def parse(self, file_path: Path, profiler: Optional["IngestionProfiler"] = None) -> List[Chunk]:
         """
         Parse a regulation document into chunks
 
         Args:
             file_path: Path to the regulation document
+            profiler: Optional profiler collecting per-stage timings
 
         Returns:
             List of Chunk objects with text and metadata
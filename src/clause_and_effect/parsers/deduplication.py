@@ -0,0 +1,185 @@
+"""
+Near-duplicate chunk detection with MinHash + LSH
+
+Regulation text repeats itself ("in accordance with the examination
+procedure referred to in Article 93(2)", echoed definitions, consolidated
+versions). Collapsing near-identical chunks before embedding saves
+embedding calls, vector storage and top_k slots; the surviving canonical
+chunk lists every place the text appears. Only chunks of the same
+regulation and jurisdiction are merged, so regulation/jurisdiction
+filters and shards still find every text.
+"""
+import itertools
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+
+from .base_parser import Chunk
+
+
+@dataclass
+class DedupReport:
+    """Outcome of a deduplication pass."""
+    threshold:     float
+    input_chunks:  int
+    output_chunks: int
+    clusters:      List[Dict[str, Any]] = field(default_factory=list)  # canonical, duplicates, min_similarity
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "threshold": self.threshold,
+            "input_chunks": self.input_chunks,
+            "output_chunks": self.output_chunks,
+            "collapsed_chunks": self.input_chunks - self.output_chunks,
+            "clusters": self.clusters,
+        }
+
+
+class NearDuplicateDetector:
+    """Collapse chunks whose word-shingle Jaccard similarity clears a threshold"""
+
+    _PRIME = (1 << 31) - 1  # Mersenne prime; a * h stays below 2**63 for 32-bit hashes
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        Args:
+            threshold:    Minimum Jaccard similarity for two chunks to be merged
+            num_perm:     MinHash signature length
+            shingle_size: Words per shingle
+            seed:         Seed for the hash permutations
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = self._optimal_bands(threshold, num_perm)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, self._PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, self._PRIME, size=num_perm, dtype=np.uint64)
+
+    def deduplicate(self, chunks: List[Chunk]) -> Tuple[List[Chunk], DedupReport]:
+        """
+        Collapse near-duplicate chunks
+
+        Args:
+            chunks: Chunks in document order
+
+        Returns:
+            Canonical chunks (document order kept) and a report of what was merged
+        """
+        shingles = [self._shingles(chunk.text) for chunk in chunks]
+        # Merging within one scope keeps the canonical chunk's filterable fields true for its duplicates
+        scopes = [(chunk.metadata.get("regulation"), chunk.metadata.get("jurisdiction")) for chunk in chunks]
+        signatures = np.stack([self._signature(s) for s in shingles]) if chunks else np.empty((0, self.num_perm))
+
+        # LSH: chunks of one scope sharing any band bucket become candidates;
+        # verify every pair in a bucket with exact Jaccard (buckets are tiny)
+        parent = list(range(len(chunks)))
+        merged_similarities: Dict[Tuple[int, int], float] = {}
+        checked: Set[Tuple[int, int]] = set()
+        for band in range(self.bands):
+            buckets: Dict[Tuple[Tuple, bytes], List[int]] = {}
+            band_rows = signatures[:, band * self.rows:(band + 1) * self.rows]
+            for idx, row in enumerate(band_rows):
+                buckets.setdefault((scopes[idx], row.tobytes()), []).append(idx)
+
+            for members in buckets.values():
+                for pair in itertools.combinations(members, 2):
+                    if pair in checked or self._find(parent, pair[0]) == self._find(parent, pair[1]):
+                        continue
+                    checked.add(pair)
+                    similarity = self._jaccard(shingles[pair[0]], shingles[pair[1]])
+                    if similarity >= self.threshold:
+                        self._union(parent, *pair)
+                        merged_similarities[pair] = similarity
+
+        clusters: Dict[int, List[int]] = {}
+        for idx in range(len(chunks)):
+            clusters.setdefault(self._find(parent, idx), []).append(idx)
+
+        cluster_similarities: Dict[int, List[float]] = {}
+        for (first, _), similarity in merged_similarities.items():
+            cluster_similarities.setdefault(self._find(parent, first), []).append(similarity)
+
+        canonical_chunks = []
+        report = DedupReport(threshold=self.threshold, input_chunks=len(chunks), output_chunks=len(clusters))
+        for members in sorted(clusters.values(), key=lambda m: m[0]):
+            canonical = chunks[members[0]]
+            if len(members) == 1:
+                canonical_chunks.append(canonical)
+                continue
+
+            duplicates = [chunks[i] for i in members[1:]]
+            canonical_chunks.append(Chunk(
+                id=canonical.id,
+                text=canonical.text,
+                metadata={
+                    **canonical.metadata,
+                    "source_citations": [self._citation(chunks[i]) for i in members],
+                    "duplicate_chunk_ids": [d.id for d in duplicates],
+                },
+            ))
+            report.clusters.append({
+                "canonical": canonical.id,
+                "duplicates": [d.id for d in duplicates],
+                "min_similarity": min(cluster_similarities.get(members[0], [1.0])),
+            })
+
+        print(f"✅ Collapsed {report.input_chunks - report.output_chunks} near-duplicate chunks "
+              f"into {len(report.clusters)} canonical chunks")
+        return canonical_chunks, report
+
+    # ------------------------------------------------------------------ #
+    #  Private helpers                                                     #
+    # ------------------------------------------------------------------ #
+
+    def _shingles(self, text: str) -> Set[str]:
+        # Drop the "Article N: Title" header, which differs even between identical bodies
+        body = text.split("\n\n", 1)[-1]
+        words = re.findall(r"\w+", body.lower())
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)}
+        return {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def _signature(self, shingles: Set[str]) -> np.ndarray:
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % self._PRIME
+        return permuted.min(axis=0)
+
+    @staticmethod
+    def _jaccard(a: Set[str], b: Set[str]) -> float:
+        return len(a & b) / len(a | b) if a or b else 1.0
+
+    @staticmethod
+    def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+        """(bands, rows) whose LSH S-curve midpoint (1/b)^(1/r) is closest to the threshold"""
+        options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+        return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+
+    @staticmethod
+    def _find(parent: List[int], idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    @classmethod
+    def _union(cls, parent: List[int], a: int, b: int):
+        root_a, root_b = cls._find(parent, a), cls._find(parent, b)
+        # Lowest index (earliest in the document) stays the root
+        parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    @staticmethod
+    def _citation(chunk: Chunk) -> Dict[str, Any]:
+        return {
+            "chunk_id": chunk.id,
+            "regulation": chunk.metadata.get("regulation"),
+            "article_number": chunk.metadata.get("article_number"),
+            "paragraph": chunk.metadata.get("paragraph"),
+        }
@@ -6,10 +6,11 @@ import pypdf
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
 from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.pipeline_options import RapidOcrOptions, ThreadedPdfPipelineOptions
+from docling.datamodel.settings import settings as docling_settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
-from docling.utils.profiling import ProfilingItem
 
+from ..profiling import IngestionProfiler, profile_stage
 from .base_parser import BaseParser, Chunk
 
 
@@ -19,6 +20,8 @@ class GDPRParser(BaseParser):
     Handles the structure of GDPR regulation (99 articles + recitals)
     """
 
+    VERSION = "2"  # parent / sibling links in chunk metadata
+
     # GDPR has 11 chapters
     CHAPTER_TITLES = {
         "1": "General provisions",
@@ -37,12 +40,13 @@ class GDPRParser(BaseParser):
     def __init__(self):
         super().__init__("GDPR")
 
-    def parse(self, file_path: Path) -> List[Chunk]:
+    def parse(self, file_path: Path, profiler: IngestionProfiler | None = None) -> List[Chunk]:
         """
         Parse GDPR PDF into article-level chunks
 
         Args:
             file_path: Path to GDPR PDF file
+            profiler: Optional profiler collecting docling and parser stage timings
 
         Returns:
             List of Chunk objects, one per article (or paragraph for long articles)
@@ -73,19 +77,39 @@ class GDPRParser(BaseParser):
 
         doc_converter.initialize_pipeline(InputFormat.PDF)
 
-        document = document_converter.convert(file_path)
+        # docling only records its per-stage ProfilingItems when asked to; the
+        # setting is process-global, so restore the caller's value afterwards
+        profile_timings = docling_settings.debug.profile_pipeline_timings
+        if profiler is not None:
+            docling_settings.debug.profile_pipeline_timings = True
+        try:
+            with profile_stage(profiler, "docling_convert"):
+                document = document_converter.convert(file_path)
+        finally:
+            docling_settings.debug.profile_pipeline_timings = profile_timings
         assert document.status == ConversionStatus.SUCCESS
 
+        if profiler is not None:
+            profiler.add_docling_timings(document)
+
+        with profile_stage(profiler, "export_markdown"):
+            text = document.document.export_to_markdown()
+
         # Extract articles
-        articles = self._extract_articles(text=document.document.export_to_markdown())
+        with profile_stage(profiler, "extract_articles"):
+            articles = self._extract_articles(text=text)
 
         print(f"✅ Extracted {len(articles)} articles from GDPR")
 
         # Convert to chunks
         chunks = []
-        for article in articles:
-            article_chunks = self._article_to_chunks(article)
-            chunks.extend(article_chunks)
+        with profile_stage(profiler, "article_to_chunks", items=len(articles)):
+            for article in articles:
+                article_chunks = self._article_to_chunks(article)
+                chunks.extend(article_chunks)
+
+        if profiler is not None:
+            profiler.counters["articles"] += len(articles)
 
         print(f"✅ Created {len(chunks)} chunks from GDPR")
 
@@ -184,7 +208,8 @@ class GDPRParser(BaseParser):
             "jurisdiction": "EU",
             "effective_date": "2018-05-25",
             "topics": self._extract_topics(full_text),
-            "chunk_type": "article"
+            "chunk_type": "article",
+            "parent_id": self._create_chunk_id(article_num),
         }
 
         # If article is short enough, return as single chunk
@@ -205,7 +230,10 @@ class GDPRParser(BaseParser):
             para_metadata = {
                 **base_metadata,
                 "paragraph": str(i),
-                "chunk_type": "paragraph"
+                "chunk_type": "paragraph",
+                # Sibling links for hierarchical retrieval
+                "prev_chunk_id": self._create_chunk_id(article_num, str(i - 1)) if i > 1 else None,
+                "next_chunk_id": self._create_chunk_id(article_num, str(i + 1)) if i < len(paragraphs) else None,
             }
 
             para_full_text = f"Article {article_num}.{i}: {title}\n\n{para_text}"
@@ -0,0 +1,6 @@
+from .ingestion_profiler import IngestionProfiler, profile_stage
+
+__all__ = [
+    'IngestionProfiler',
+    'profile_stage',
+]
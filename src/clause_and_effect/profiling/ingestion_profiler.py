@@ -0,0 +1,156 @@
+"""
+Ingestion profiling: per-stage wall time, throughput and peak memory
+
+Memory is sampled from the process high-water mark (ru_maxrss, or the
+peak working set via psutil on Windows), which never goes down: each
+stage reports how much it raised that mark and the running mark when it
+finished. Memory columns are None where neither source is available.
+
+Collects docling's own pipeline timings alongside our stages
+(article extraction, chunking, embedding, upserts) and writes a
+machine-readable JSON report plus a readable summary table.
+"""
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict
+
+from rich.console import Console
+from rich.table import Table
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class IngestionProfiler:
+    """Accumulates timings for named ingestion stages"""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.docling_timings: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {"pages": 0, "articles": 0, "chunks": 0}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0):
+        """
+        Time a block of work
+
+        Args:
+            name:  Stage name; repeated calls accumulate
+            items: Number of items (pages, chunks, ...) processed in the block
+        """
+        start = time.perf_counter()
+        start_peak = self.peak_rss_mb()
+        try:
+            yield
+        finally:
+            stats = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "items": 0,
+                                                  "peak_rss_growth_mb": None, "rss_high_water_mb": None})
+            end_peak = self.peak_rss_mb()
+            stats["seconds"] += time.perf_counter() - start
+            stats["calls"] += 1
+            stats["items"] += items
+            if start_peak is not None and end_peak is not None:
+                stats["peak_rss_growth_mb"] = (stats["peak_rss_growth_mb"] or 0.0) + end_peak - start_peak
+                stats["rss_high_water_mb"] = end_peak
+
+    def add_docling_timings(self, conversion_result: Any):
+        """
+        Record docling's per-stage timings from a ConversionResult
+
+        Requires ``docling.datamodel.settings.settings.debug.profile_pipeline_timings``
+        to be enabled before the conversion runs.
+        """
+        for name, item in conversion_result.timings.items():
+            times = list(item.times)
+            self.docling_timings[name] = {
+                "seconds": sum(times),
+                "count": item.count,
+                "mean_seconds": sum(times) / len(times) if times else 0.0,
+                "max_seconds": max(times, default=0.0),
+            }
+        self.counters["pages"] += conversion_result.input.page_count
+
+    @staticmethod
+    def peak_rss_mb() -> float | None:
+        """Process peak resident set size so far, in MiB (None when the platform offers no source)"""
+        if resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Linux reports KiB, macOS reports bytes
+            return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+        try:
+            import psutil
+        except ImportError:
+            return None
+        # Peak working set, reported on Windows only
+        peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        return peak / (1024 * 1024) if peak is not None else None
+
+    def report(self) -> Dict[str, Any]:
+        """Machine-readable report"""
+        def rate(count: int, *stage_names: str) -> float | None:
+            seconds = sum(self.stages.get(n, {}).get("seconds", 0.0) for n in stage_names)
+            return count / seconds if seconds > 0 else None
+
+        return {
+            "total_seconds": time.perf_counter() - self._start,
+            "peak_rss_mb": self.peak_rss_mb(),
+            "counters": dict(self.counters),
+            "throughput": {
+                "pages_per_second": rate(self.counters["pages"], "docling_convert"),
+                "chunks_per_second": rate(self.counters["chunks"], "embed_batch", "upsert"),
+            },
+            "stages": self.stages,
+            "docling": self.docling_timings,
+        }
+
+    def write(self, path: Path) -> Dict[str, Any]:
+        """Write the JSON report and print the summary"""
+        report = self.report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+        self.print_summary(report)
+        print(f"✅ Profiling report written to {path}")
+        return report
+
+    @staticmethod
+    def print_summary(report: Dict[str, Any]):
+        """Readable summary table"""
+        table = Table(title="Ingestion profile")
+        table.add_column("Stage")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Calls", justify="right")
+        table.add_column("Items", justify="right")
+        table.add_column("Peak growth (MiB)", justify="right")
+        table.add_column("RSS high-water (MiB)", justify="right")
+
+        def mib(value: float | None) -> str:
+            return f"{value:.0f}" if value is not None else "n/a"
+
+        for name, stats in report["stages"].items():
+            table.add_row(name, f"{stats['seconds']:.2f}", str(stats["calls"]), str(stats["items"]),
+                          mib(stats["peak_rss_growth_mb"]), mib(stats["rss_high_water_mb"]))
+        for name, stats in report["docling"].items():
+            table.add_row(f"  docling: {name}", f"{stats['seconds']:.2f}", str(stats["count"]), "", "", "")
+
+        console = Console()
+        console.print(table)
+
+        throughput = report["throughput"]
+        pages_rate = throughput["pages_per_second"]
+        chunks_rate = throughput["chunks_per_second"]
+        console.print(f"Total {report['total_seconds']:.2f}s | peak RSS {mib(report['peak_rss_mb'])} MiB | "
+                      f"{pages_rate or 0:.2f} pages/s | {chunks_rate or 0:.2f} chunks/s")
+
+
+def profile_stage(profiler: IngestionProfiler | None, name: str, items: int = 0):
+    """``profiler.stage(...)`` or a no-op when profiling is off"""
+    return profiler.stage(name, items=items) if profiler is not None else nullcontext()
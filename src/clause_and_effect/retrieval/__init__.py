@@ -1,7 +1,13 @@
 from .embedding_generator import EmbeddingGenerator
+from .chunk_store import ChunkStore
+from .query_expansion import QueryExpander
 from .vector_db import VectorDatabase
+from .snapshot import SnapshotBundle
 
 __all__ = [
+    "ChunkStore",
     "EmbeddingGenerator",
+    "QueryExpander",
+    "SnapshotBundle",
     "VectorDatabase",
 ]
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Local, memory-mapped chunk text store
+
+Lets Qdrant keep only vectors plus filterable fields: chunk text and full
+metadata are written once at index time and resolved locally by the
+point's ordinal ID at query time.
+
+Every index run writes its own version directory, named after the
+index_version stored in the point payloads, so a collection always
+resolves against the store it was built with - also while another
+process is re-indexing, or after a run died halfway.
+
+On-disk layout:
+    <store_dir>/<index_version>/records.bin  - UTF-8 JSON records, concatenated
+    <store_dir>/<index_version>/offsets.npy  - int64 array of n+1 byte offsets into records.bin
+"""
+import json
+import mmap
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.clause_and_effect.parsers import Chunk
+
+
+class ChunkStore:
+    """Immutable, versioned chunk stores addressed by (index_version, ordinal == Qdrant point ID)"""
+
+    RECORDS_FILE = "records.bin"
+    OFFSETS_FILE = "offsets.npy"
+
+    def __init__(self, store_dir: Path):
+        self.store_dir = Path(store_dir)
+        # version -> (records, offsets), published as one tuple so readers
+        # on other threads never see a half-opened store
+        self._opened: Dict[str, Tuple[mmap.mmap | bytes, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def write(self, chunks: List[Chunk], version: str):
+        """
+        Write the chunks as a new store version
+
+        Versions are content fingerprints and never modified once written,
+        so writing an existing version is a no-op.
+
+        Args:
+            chunks:  Chunks in indexing order; position i becomes point ID i
+            version: index_version of the collection the chunks are indexed into
+        """
+        version_dir = self.store_dir / version
+        if (version_dir / self.OFFSETS_FILE).exists():
+            print(f"✅ Chunk store version '{version}' already exists")
+            return
+
+        tmp_dir = self.store_dir / f".{version}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        with open(tmp_dir / self.RECORDS_FILE, "wb") as f:
+            for i, chunk in enumerate(chunks):
+                record = json.dumps(
+                    {"chunk_id": chunk.id, "text": chunk.text, "metadata": chunk.metadata},
+                    ensure_ascii=False,
+                ).encode("utf-8")
+                f.write(record)
+                offsets[i + 1] = offsets[i] + len(record)
+
+        with open(tmp_dir / self.OFFSETS_FILE, "wb") as f:
+            np.save(f, offsets)
+
+        # Publish the complete directory in one rename
+        try:
+            os.replace(tmp_dir, version_dir)
+        except OSError:
+            # Another process published the same version first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not (version_dir / self.OFFSETS_FILE).exists():
+                raise
+
+        print(f"✅ Wrote {len(chunks)} chunks to local store '{version_dir}'")
+
+    def get(self, ordinal: int, version: str) -> Dict[str, Any]:
+        """
+        Resolve a chunk by ordinal
+
+        Args:
+            ordinal: Position of the chunk at index time (the Qdrant point ID)
+            version: index_version recorded in the point's payload
+
+        Returns:
+            Dict with chunk_id, text and metadata
+        """
+        records, offsets = self._open(version)
+        if not 0 <= ordinal < len(offsets) - 1:
+            raise IndexError(f"Point {ordinal} is not in chunk store version '{version}'")
+        start, end = int(offsets[ordinal]), int(offsets[ordinal + 1])
+        return json.loads(records[start:end].decode("utf-8"))
+
+    def versions(self) -> List[str]:
+        """Store versions present on disk"""
+        if not self.store_dir.exists():
+            return []
+        return sorted(d.name for d in self.store_dir.iterdir()
+                      if d.is_dir() and (d / self.OFFSETS_FILE).exists())
+
+    def prune(self, keep: Iterable[str | None]):
+        """
+        Delete every store version not in ``keep``
+
+        Args:
+            keep: Versions still referenced by a collection (None entries are ignored)
+        """
+        keep = {version for version in keep if version is not None}
+        for version in self.versions():
+            if version in keep:
+                continue
+            with self._lock:
+                # Maps still in use by other threads are left to the garbage collector
+                self._opened.pop(version, None)
+            shutil.rmtree(self.store_dir / version, ignore_errors=True)
+            print(f"🧹 Removed chunk store version '{version}'")
+
+    def close(self):
+        """Release the memory maps"""
+        with self._lock:
+            for records, _ in self._opened.values():
+                if isinstance(records, mmap.mmap):
+                    records.close()
+            self._opened = {}
+
+    def _open(self, version: str) -> Tuple[mmap.mmap | bytes, np.ndarray]:
+        opened = self._opened.get(version)
+        if opened is not None:
+            return opened
+
+        with self._lock:
+            opened = self._opened.get(version)
+            if opened is not None:
+                return opened
+
+            version_dir = self.store_dir / version
+            offsets_path = version_dir / self.OFFSETS_FILE
+            if not offsets_path.exists():
+                raise FileNotFoundError(f"Chunk store version '{version}' not found in '{self.store_dir}', "
+                                        f"run indexing first")
+
+            offsets = np.load(offsets_path, mmap_mode="r")
+            with open(version_dir / self.RECORDS_FILE, "rb") as f:
+                # mmap of an empty file is not allowed; an empty store has no records to read anyway
+                records = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if offsets[-1] > 0 else b""
+
+            self._opened = {**self._opened, version: (records, offsets)}
+            return records, offsets
@@ -0,0 +1,114 @@
+"""
+Query expansion for multi-query retrieval
+
+Users rarely phrase questions in the regulation's own vocabulary
+("right to be forgotten" vs. "erasure"). The expander produces a few
+variants from a legal-synonym table and, optionally, a cheap LLM rewrite;
+the variants are then searched together and fused by reciprocal rank.
+"""
+import re
+from typing import Any, Dict, List
+
+from ai_common import get_llm
+
+
+# Colloquial phrase -> terms used in the regulation text
+LEGAL_SYNONYMS: Dict[str, List[str]] = {
+    "right to be forgotten": ["right to erasure"],
+    "delete": ["erasure"],
+    "deletion": ["erasure"],
+    "data breach": ["personal data breach notification"],
+    "breach": ["personal data breach"],
+    "fine": ["administrative fine"],
+    "fines": ["administrative fines"],
+    "penalty": ["administrative fine"],
+    "opt out": ["right to object"],
+    "opt-out": ["right to object"],
+    "privacy policy": ["information to be provided to the data subject"],
+    "user": ["data subject"],
+    "users": ["data subjects"],
+    "customer data": ["personal data"],
+    "vendor": ["processor"],
+    "subprocessor": ["sub-processor"],
+    "dpo": ["data protection officer"],
+    "dpia": ["data protection impact assessment"],
+    "cross-border transfer": ["transfer of personal data to third countries"],
+    "data portability": ["right to data portability"],
+    "profiling": ["automated individual decision-making, including profiling"],
+}
+
+REWRITE_PROMPT = """\
+Rewrite the compliance question below into {n} alternative search queries that use
+the terminology of the regulation text itself (e.g. "erasure" rather than "deletion").
+Return one query per line, with no numbering or commentary.
+
+Question: {question}
+"""
+
+
+class QueryExpander:
+    """Expand a query into several retrieval variants"""
+
+    def __init__(self, llm_params: Dict[str, Any] | None = None, max_variants: int = 4):
+        """
+        Args:
+            llm_params:   llm_config entry used for rewrites; synonym table only when None
+            max_variants: Cap on the number of queries returned (original included)
+        """
+        self.max_variants = max_variants
+        self.llm = None
+        if llm_params is not None:
+            self.llm = get_llm(model_name=llm_params['model'],
+                               model_provider=llm_params['model_provider'],
+                               api_key=llm_params['api_key'],
+                               model_args=llm_params['model_args'])
+
+    def expand(self, query: str) -> List[str]:
+        """
+        Produce retrieval variants of a query
+
+        Args:
+            query: User's question
+
+        Returns:
+            Distinct queries, the original first
+        """
+        variants = [query, *self._synonym_variants(query)]
+        if self.llm is not None:
+            variants.extend(self._llm_variants(query))
+
+        # Case-insensitive de-duplication keeping the first occurrence, so the original stays first
+        unique, seen = [], set()
+        for variant in (v.strip() for v in variants):
+            if variant and variant.casefold() not in seen:
+                seen.add(variant.casefold())
+                unique.append(variant)
+        return unique[:self.max_variants]
+
+    @staticmethod
+    def _synonym_variants(query: str) -> List[str]:
+        variants = []
+        matched_spans = []
+
+        # Longest phrases first, so "data breach" wins over the "breach" inside it
+        for phrase in sorted(LEGAL_SYNONYMS, key=len, reverse=True):
+            match = re.search(rf"\b{re.escape(phrase)}\b", query, re.IGNORECASE)
+            if match is None or any(match.start() < end and start < match.end() for start, end in matched_spans):
+                continue
+            matched_spans.append(match.span())
+            variants.extend(query[:match.start()] + replacement + query[match.end():]
+                            for replacement in LEGAL_SYNONYMS[phrase])
+        return variants
+
+    def _llm_variants(self, query: str) -> List[str]:
+        """LLM rewrites; empty when the rewrite call fails, leaving the synonym variants"""
+        try:
+            response = self.llm.invoke(
+                input=[{"role": "user", "content": REWRITE_PROMPT.format(n=self.max_variants - 1, question=query)}],
+            )
+            # Same response shape as Generator: the last content block holds the text
+            text = response.content_blocks[-1]['text']
+        except Exception as e:
+            print(f"⚠️ Query rewrite failed, using synonym variants only: {e}")
+            return []
+        return [line.strip(" -*\t") for line in text.splitlines() if line.strip(" -*\t")]
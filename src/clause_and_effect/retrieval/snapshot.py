@@ -0,0 +1,252 @@
+"""
+Portable index snapshot bundles
+
+A bundle captures an indexed collection so new environments can be
+stood up without re-parsing or re-embedding:
+
+    manifest.json   - format version, counts, vector shape, fingerprints
+    vectors.f32     - float32 vectors, one contiguous row-major (n, dim) array
+    payloads.jsonl  - Qdrant payload per point, same order as the vectors
+    chunks.jsonl    - chunk_id, text and metadata per point, same order
+    article_index.json - optional ArticleIndex built from the pre-deduplication
+                      chunks, so hierarchical expansion and direct lookups
+                      keep every paragraph after an import
+
+The vector file can be bulk-uploaded into Qdrant or memory-mapped and
+searched directly as a local backend.
+"""
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+from src.clause_and_effect.parsers import ArticleIndex, Chunk
+from src.clause_and_effect.retrieval import VectorDatabase
+
+
+class SnapshotBundle:
+    """Versioned on-disk copy of an indexed collection"""
+
+    FORMAT_VERSION = 1
+    MANIFEST_FILE = "manifest.json"
+    VECTORS_FILE = "vectors.f32"
+    PAYLOADS_FILE = "payloads.jsonl"
+    CHUNKS_FILE = "chunks.jsonl"
+    ARTICLE_INDEX_FILE = "article_index.json"
+
+    def __init__(self, bundle_dir: Path):
+        self.bundle_dir = Path(bundle_dir)
+        manifest_path = self.bundle_dir / self.MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No snapshot manifest at '{manifest_path}'")
+
+        self.manifest: Dict[str, Any] = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if self.manifest["format_version"] != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format {self.manifest['format_version']}, "
+                             f"expected {self.FORMAT_VERSION}")
+
+        self._vectors: np.ndarray | None = None
+        self._chunks: List[Dict[str, Any]] | None = None
+
+    @classmethod
+    def export(cls,
+               vector_db: VectorDatabase,
+               bundle_dir: Path,
+               batch_size: int = 256) -> "SnapshotBundle":
+        """
+        Write every point of a collection (and its article index, if loaded) to a bundle
+
+        Args:
+            vector_db:  Database whose collection is exported
+            bundle_dir: Output directory (created if missing)
+            batch_size: Points fetched per scroll request
+
+        Returns:
+            The written bundle
+        """
+        if vector_db.sharded:
+            raise ValueError("Snapshot export supports the single-collection layout only")
+        if vector_db.client.count(collection_name=vector_db.collection_name, exact=True).count == 0:
+            raise ValueError(f"Collection '{vector_db.collection_name}' is empty, nothing to export")
+
+        bundle_dir = Path(bundle_dir)
+        bundle_dir.mkdir(parents=True, exist_ok=True)
+        print(f"📦 Exporting collection '{vector_db.collection_name}' to {bundle_dir}")
+
+        count, dim, offset = 0, None, None
+        exported_chunks = []
+        parser_fingerprints = set()
+        with open(bundle_dir / cls.VECTORS_FILE, "wb") as vectors_file, \
+                open(bundle_dir / cls.PAYLOADS_FILE, "w", encoding="utf-8") as payloads_file, \
+                open(bundle_dir / cls.CHUNKS_FILE, "w", encoding="utf-8") as chunks_file:
+            while True:
+                records, offset = vector_db.client.scroll(
+                    collection_name=vector_db.collection_name,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True,
+                )
+                if records:
+                    vectors = np.asarray([r.vector for r in records], dtype=np.float32)
+                    dim = vectors.shape[1]
+                    vectors.tofile(vectors_file)
+
+                    for record, chunk in zip(records, vector_db._format_points(records)):
+                        payloads_file.write(json.dumps(record.payload, ensure_ascii=False) + "\n")
+                        parser_fingerprints.add(record.payload.get("parser_fingerprint"))
+                        chunk.pop("score", None)
+                        chunks_file.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+                        exported_chunks.append(Chunk(id=chunk["chunk_id"], text=chunk["text"], metadata=chunk["metadata"]))
+                    count += len(records)
+
+                if offset is None:
+                    break
+
+        # The parser recorded at index time, not whichever parser is current now
+        parser_fingerprint = parser_fingerprints.pop() if len(parser_fingerprints) == 1 else None
+        if parser_fingerprint is None:
+            print("⚠️  Indexed points do not record a single parser fingerprint")
+
+        manifest = {
+            "format_version": cls.FORMAT_VERSION,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "collection_name": vector_db.collection_name,
+            "count": count,
+            "dim": dim,
+            "dtype": "float32",
+            "distance": "cosine",
+            "payload_mode": "full" if vector_db.chunk_store is None else "slim",
+            "embedding_model": vector_db.embedding_generator.model,
+            "parser_fingerprint": parser_fingerprint,
+            "index_version": vector_db._fingerprint_chunks(exported_chunks),
+        }
+
+        # Only an article index built with this very collection may travel with it
+        article_index = vector_db.article_index
+        if article_index is not None and article_index.index_version != manifest["index_version"]:
+            print(f"⚠️  Article index was built for index version {article_index.index_version}, "
+                  f"the collection is {manifest['index_version']}; exporting without it")
+            article_index = None
+        if article_index is not None:
+            article_index.save(bundle_dir / cls.ARTICLE_INDEX_FILE)
+        manifest["article_index"] = article_index is not None
+
+        (bundle_dir / cls.MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        print(f"✅ Exported {count} points ({dim}-d vectors)")
+        return cls(bundle_dir)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Memory-mapped (count, dim) vector array"""
+        if self._vectors is None:
+            self._vectors = np.memmap(self.bundle_dir / self.VECTORS_FILE,
+                                      dtype=np.float32,
+                                      mode="r",
+                                      shape=(self.manifest["count"], self.manifest["dim"]))
+        return self._vectors
+
+    @property
+    def chunks(self) -> List[Dict[str, Any]]:
+        """Chunk records, aligned with ``vectors``"""
+        if self._chunks is None:
+            with open(self.bundle_dir / self.CHUNKS_FILE, encoding="utf-8") as f:
+                self._chunks = [json.loads(line) for line in f]
+        return self._chunks
+
+    @property
+    def article_index(self) -> ArticleIndex | None:
+        """Article index shipped with the bundle, or None for bundles exported without one"""
+        if not self.manifest.get("article_index"):
+            return None
+        return ArticleIndex.load(self.bundle_dir / self.ARTICLE_INDEX_FILE)
+
+    def payloads(self) -> Iterator[Dict[str, Any]]:
+        """Stream Qdrant payloads, aligned with ``vectors``"""
+        with open(self.bundle_dir / self.PAYLOADS_FILE, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def load_into(self, vector_db: VectorDatabase, parallel: int = 4, batch_size: int = 256):
+        """
+        Bulk-load the bundle into a Qdrant collection, without any embedding calls
+
+        Like ``VectorDatabase.index_chunks``, the points go into a fresh
+        collection that replaces the current one behind the collection alias.
+
+        Args:
+            vector_db:  Target database
+            parallel:   Parallel upload workers
+            batch_size: Points per upload request
+        """
+        if self.manifest["embedding_model"] != vector_db.embedding_generator.model:
+            raise ValueError(f"Snapshot was embedded with '{self.manifest['embedding_model']}', "
+                             f"but the database queries with '{vector_db.embedding_generator.model}'")
+
+        if vector_db.sharded:
+            raise ValueError("Snapshot import supports the single-collection layout only")
+
+        print(f"📦 Loading {self.manifest['count']} points into '{vector_db.collection_name}'")
+
+        chunks = [Chunk(id=c["chunk_id"], text=c["text"], metadata=c["metadata"]) for c in self.chunks]
+        target_mode = "full" if vector_db.chunk_store is None else "slim"
+
+        index_version = self.manifest["index_version"]
+        previous_version = vector_db.refresh_index_version()
+        if target_mode == "slim":
+            vector_db.chunk_store.write(chunks, version=index_version)
+
+        # Reuse the stored payloads when the layout matches, rebuild them otherwise;
+        # chunk_id is re-stamped because bundles exported before slim payloads carried it lack it
+        if target_mode == self.manifest["payload_mode"]:
+            payloads = ({**payload, "chunk_id": chunk.id, "index_version": index_version}
+                        for payload, chunk in zip(self.payloads(), chunks))
+        else:
+            payloads = (vector_db._build_payload(chunk, index_version, self.manifest["parser_fingerprint"])
+                        for chunk in chunks)
+
+        new_collection = vector_db._new_collection_name(vector_db.collection_name)
+        vector_db._create_collection(collection_name=new_collection, vector_size=self.manifest["dim"])
+        try:
+            vector_db.client.upload_collection(
+                collection_name=new_collection,
+                vectors=self.vectors,
+                payload=payloads,
+                ids=range(self.manifest["count"]),  # ordinal IDs, matching the chunk store
+                batch_size=batch_size,
+                parallel=parallel,
+                wait=True,
+            )
+        except BaseException:
+            vector_db.client.delete_collection(collection_name=new_collection)
+            raise
+
+        vector_db._swap_alias(alias=vector_db.collection_name, new_collection=new_collection)
+        vector_db.index_version = index_version
+        if target_mode == "slim":
+            vector_db.chunk_store.prune(keep=[index_version, previous_version])
+
+        print(f"✅ Loaded snapshot {self.manifest['index_version']} into '{vector_db.collection_name}'")
+
+    def search(self, query_embedding: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Brute-force cosine search over the memory-mapped vectors (local backend)
+
+        Args:
+            query_embedding: Query vector from the bundle's embedding model
+            top_k:           Number of results to return
+
+        Returns:
+            List of search results with scores, as ``VectorDatabase.search`` returns them
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = (self.vectors @ query) / (np.linalg.norm(self.vectors, axis=1) * np.linalg.norm(query) + 1e-12)
+
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+
+        return [{**self.chunks[i], "score": float(scores[i])} for i in best]
@@ -1,27 +1,60 @@
 """
 Vector database operations using Qdrant
 """
+import hashlib
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from pydantic import SecretStr
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    CreateAlias, CreateAliasOperation, DeleteAlias, DeleteAliasOperation, Distance, FieldCondition,
+    Filter, MatchAny, PayloadSchemaType, PointStruct, QueryRequest, ScoredPoint, VectorParams,
+)
 from tqdm import tqdm
 
-from src.clause_and_effect.parsers import Chunk
-from src.clause_and_effect.retrieval import EmbeddingGenerator
+from src.clause_and_effect.parsers import ArticleIndex, Chunk
+from src.clause_and_effect.profiling import IngestionProfiler, profile_stage
+from src.clause_and_effect.retrieval import ChunkStore, EmbeddingGenerator
 
 
 class VectorDatabase:
     """Qdrant vector database wrapper"""
 
+    # Metadata kept in slim payloads so Qdrant can still filter on them
+    FILTERABLE_FIELDS = ["regulation", "jurisdiction", "article_number", "chapter", "chunk_type", "topics"]
+
     def __init__(self,
                  vector_db_url: SecretStr,
                  vector_db_port: int,
                  vector_db_api_key: SecretStr,
                  collection_name: str,
                  embedding_model: str,
-                 embedding_model_api_key: SecretStr):
+                 embedding_model_api_key: SecretStr,
+                 chunk_store: ChunkStore | None = None,
+                 article_index: ArticleIndex | None = None,
+                 sharded: bool = False,
+                 index_version_ttl: float = 10.0):
+        """
+        Args:
+            chunk_store:   Local chunk store; when given, Qdrant payloads are slimmed
+                           down to the filterable fields and text is resolved locally
+            article_index: Article/paragraph index enabling ``search_hierarchical``
+            sharded:       One collection per regulation, reached through the alias
+                           "<collection_name>_<regulation>"; queries fan out to shards
+            index_version_ttl: Seconds before ``index_version`` and the shard list are
+                           re-read from Qdrant, so re-indexes and shards added by
+                           other processes are picked up
+        """
+        if sharded and chunk_store is not None:
+            # Ordinal point IDs are per shard, so a single chunk store cannot resolve them
+            raise ValueError("Sharded collections do not support slim payloads")
+
         self.collection_name = collection_name
+        self.chunk_store = chunk_store
+        self.article_index = article_index
+        self.sharded = sharded
         self.client = QdrantClient(
             api_key=vector_db_api_key.get_secret_value(),
             url=vector_db_url.get_secret_value(),
@@ -29,30 +62,199 @@ class VectorDatabase:
         )
         self.embedding_generator = EmbeddingGenerator(model=embedding_model, api_key=embedding_model_api_key)
 
-    def create_collection(self, vector_size: int = 1536):
-        """Create collection if it doesn't exist"""
+        # Fingerprint of the indexed content; changes on every re-index so
+        # downstream caches can tell stale entries apart. Stored in every
+        # point's payload and re-read every ``index_version_ttl`` seconds.
+        self.index_version_ttl = index_version_ttl
+        self._index_version: str | None = None
+        self._index_version_checked_at: float | None = None
 
-        if self.client.collection_exists(self.collection_name):
-            print(f"✅ Collection '{self.collection_name}' already exists")
-        else:
-            # Create new collection
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=vector_size,
-                    distance=Distance.COSINE
-                )
-            )
-            print(f"✅ Created collection '{self.collection_name}'")
+        # Sharded layout: alias -> regulation, alias -> jurisdictions recorded at
+        # rebuild time (None for shards built without them), and per-shard content fingerprints
+        self.shards: Dict[str, str] | None = None
+        self.shard_jurisdictions: Dict[str, List[str] | None] = {}
+        self._shards_checked_at: float | None = None
+        self.shard_versions: Dict[str, str] = {}
+        self._executor = ThreadPoolExecutor(thread_name_prefix="qdrant-shard") if sharded else None
 
+    def create_collection(self, vector_size: int = 1536):
+        """
+        Kept for backwards compatibility: collections are now created by every
+        index run (``index_chunks``, ``rebuild_shard``, snapshot import) and
+        swapped in behind the collection alias
+        """
 
-    def index_chunks(self, chunks: List[Chunk]):
+    def index_chunks(self,
+                     chunks: List[Chunk],
+                     vector_size: int = 1536,
+                     profiler: IngestionProfiler | None = None,
+                     parser_fingerprint: str | None = None):
         """
         Index chunks into vector database
 
+        The chunks are indexed into a fresh collection which then replaces the
+        previous one behind the ``collection_name`` alias in a single alias
+        update, so queries never see a half-written index and a failed run
+        leaves the previous index serving. In the sharded layout every
+        regulation present in ``chunks`` gets its shard rebuilt; shards of
+        other regulations are left untouched.
+
         Args:
             chunks: List of Chunk objects to index
+            vector_size: Embedding dimension
+            profiler: Optional profiler timing the embedding and upsert stages
+            parser_fingerprint: ``BaseParser.fingerprint()`` of the parser that produced
+                the chunks, stored in every payload for snapshot manifests
+        """
+        if self.sharded:
+            by_regulation: Dict[str, List[Chunk]] = {}
+            for chunk in chunks:
+                by_regulation.setdefault(chunk.metadata["regulation"], []).append(chunk)
+            for regulation, regulation_chunks in by_regulation.items():
+                self.rebuild_shard(regulation=regulation,
+                                   chunks=regulation_chunks,
+                                   vector_size=vector_size,
+                                   profiler=profiler,
+                                   parser_fingerprint=parser_fingerprint)
+            return
+
+        index_version = self._fingerprint_chunks(chunks)
+        previous_version = self.refresh_index_version()
+
+        if self.chunk_store is not None:
+            # Written under its own version before any point references it
+            with profile_stage(profiler, "chunk_store_write", items=len(chunks)):
+                self.chunk_store.write(chunks, version=index_version)
+
+        new_collection = self._new_collection_name(self.collection_name)
+        self._create_collection(collection_name=new_collection, vector_size=vector_size)
+        try:
+            self._index_into(collection_name=new_collection,
+                             chunks=chunks,
+                             index_version=index_version,
+                             profiler=profiler,
+                             parser_fingerprint=parser_fingerprint)
+        except BaseException:
+            self.client.delete_collection(collection_name=new_collection)
+            raise
+
+        self._swap_alias(alias=self.collection_name, new_collection=new_collection)
+        self.index_version = index_version
+
+        if self.chunk_store is not None:
+            # The previous version stays for queries still running against the old collection
+            self.chunk_store.prune(keep=[index_version, previous_version])
+
+    def rebuild_shard(self,
+                      regulation: str,
+                      chunks: List[Chunk],
+                      vector_size: int = 1536,
+                      profiler: IngestionProfiler | None = None,
+                      parser_fingerprint: str | None = None):
+        """
+        Rebuild one regulation's shard and swap it in atomically
+
+        The new collection is fully indexed before the shard alias is moved
+        to it in a single alias update, so queries never see a partial shard.
+
+        Args:
+            regulation:  Regulation the chunks belong to
+            chunks:      All chunks of that regulation
+            vector_size: Embedding dimension
+            profiler:    Optional profiler timing the embedding and upsert stages
+            parser_fingerprint: Fingerprint of the parser that produced the chunks
+        """
+        if not self.sharded:
+            raise ValueError("rebuild_shard requires the sharded layout")
+
+        alias = self._shard_alias(regulation)
+        new_collection = self._new_collection_name(alias)
+
+        # Recorded on the collection so queries can skip shards a jurisdiction filter excludes
+        jurisdictions = self.normalise_filter([chunk.metadata["jurisdiction"] for chunk in chunks
+                                               if chunk.metadata.get("jurisdiction")])
+        self._create_collection(collection_name=new_collection,
+                                vector_size=vector_size,
+                                metadata={"regulation": regulation.upper(), "jurisdictions": jurisdictions})
+        try:
+            self._index_into(collection_name=new_collection,
+                             chunks=chunks,
+                             index_version=self._fingerprint_chunks(chunks),
+                             profiler=profiler,
+                             parser_fingerprint=parser_fingerprint)
+        except BaseException:
+            self.client.delete_collection(collection_name=new_collection)
+            raise
+
+        self._swap_alias(alias=alias, new_collection=new_collection)
+
+        self.refresh_shards()
+        self.refresh_index_version()
+
+    @property
+    def index_version(self) -> str | None:
+        """Fingerprint of the indexed content, re-read from Qdrant once the TTL has expired"""
+        checked_at = self._index_version_checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.index_version_ttl:
+            self.refresh_index_version()
+        return self._index_version
+
+    @index_version.setter
+    def index_version(self, value: str | None):
+        self._index_version = value
+        self._index_version_checked_at = time.monotonic()
+
+    def refresh_index_version(self) -> str | None:
         """
+        Re-read the index version stored in the collection's payloads
+
+        Needed when another process (e.g. the indexing script) re-indexed the
+        collection after this one started.
+
+        Returns:
+            The current index version, or None for an empty / legacy index
+        """
+        if self.sharded:
+            self.refresh_shards()
+            self.shard_versions = {
+                alias: version for alias in self.shards
+                if (version := self._read_stored_version(alias)) is not None
+            }
+            self.index_version = self._combine_versions(self.shard_versions) if self.shard_versions else None
+        elif self._collection_exists(self.collection_name):
+            self.index_version = self._read_stored_version(self.collection_name)
+        else:
+            self.index_version = None
+        return self._index_version
+
+    def refresh_shards(self) -> Dict[str, str]:
+        """Re-read the shard aliases, and the jurisdictions each shard holds, from Qdrant"""
+        prefix = f"{self.collection_name}_"
+        targets = {alias: collection for alias, collection in self._alias_targets().items()
+                   if alias.startswith(prefix)}
+
+        shard_jurisdictions = {}
+        for alias, collection in targets.items():
+            metadata = self.client.get_collection(collection).config.metadata or {}
+            shard_jurisdictions[alias] = metadata.get("jurisdictions")
+
+        self.shards = {alias: alias[len(prefix):].upper() for alias in targets}
+        self.shard_jurisdictions = shard_jurisdictions
+        self._shards_checked_at = time.monotonic()
+        return self.shards
+
+    @staticmethod
+    def normalise_filter(values: List[str]) -> List[str]:
+        """Regulation and jurisdiction codes are stored upper-case ("GDPR", "EU")"""
+        return sorted({value.strip().upper() for value in values})
+
+    def _index_into(self,
+                    collection_name: str,
+                    chunks: List[Chunk],
+                    index_version: str,
+                    profiler: IngestionProfiler | None,
+                    parser_fingerprint: str | None = None):
+        """Embed and upsert chunks into a fresh physical collection"""
         print(f"📊 Indexing {len(chunks)} chunks...")
 
         # Generate embeddings in batch
@@ -63,64 +265,196 @@ class VectorDatabase:
         for i in tqdm(range(0, len(texts), batch_size)):
             chunks_batch = chunks[i:i + batch_size]
             texts_batch = [c.text for c in chunks_batch]
-            batch_embeddings = self.embedding_generator.embed_batch(batch=texts_batch)
+            with profile_stage(profiler, "embed_batch", items=len(texts_batch)):
+                batch_embeddings = self.embedding_generator.embed_batch(batch=texts_batch)
 
             points = [
                 PointStruct(
-                    id = i*batch_size + j,  # Use numeric ID for Qdrant
+                    id = i + j,  # Numeric ordinal ID; doubles as the chunk store key
                     vector = embedding,
-                    payload = {
-                        "chunk_id": chunk.id,
-                        "text": chunk.text,
-                        "metadata": chunk.metadata,
-                        }
+                    payload = self._build_payload(chunk, index_version, parser_fingerprint),
                     ) for j, (chunk, embedding) in enumerate(zip(chunks_batch, batch_embeddings))
             ]
 
-            self.client.upsert(collection_name=self.collection_name, points=points)
+            with profile_stage(profiler, "upsert", items=len(points)):
+                self.client.upsert(collection_name=collection_name, points=points)
+
+        if profiler is not None:
+            profiler.counters["chunks"] += len(chunks)
 
         print(f"✅ Indexed {len(chunks)} chunks successfully")
 
-    def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def search(self,
+               query: str,
+               top_k: int = 5,
+               query_embedding: List[float] | None = None,
+               regulations: List[str] | None = None,
+               jurisdictions: List[str] | None = None) -> List[Dict[str, Any]]:
         """
         Search for similar chunks
 
         Args:
             query: Query text
             top_k: Number of results to return
+            query_embedding: Precomputed query embedding (skips the embedding call)
+            regulations: Restrict results to these regulations
+            jurisdictions: Restrict results to these jurisdictions
 
         Returns:
             List of search results with scores
         """
         # Generate query embedding
-        query_embedding = self.embedding_generator.embed_text(query)
-
-        search_result = self.client.query_points(
-            collection_name = self.collection_name,
-            query = query_embedding,
-            query_filter = None,
-            limit = top_k,
-        ).points
-
-        formatted_results = [
-            {
-                "chunk_id": result.payload["chunk_id"],
-                "text": result.payload["text"],
-                "metadata": result.payload["metadata"],
-                "score": result.score
-                }
-            for result in search_result
-        ]
+        if query_embedding is None:
+            query_embedding = self.embedding_generator.embed_text(query)
 
-        return formatted_results
+        search_result = self._query(query_embeddings=[query_embedding],
+                                    limit=top_k,
+                                    regulations=regulations,
+                                    jurisdictions=jurisdictions)[0]
+
+        return self._format_points(search_result)
+
+    def search_multi(self,
+                     queries: List[str],
+                     top_k: int = 5,
+                     query_embeddings: List[List[float]] | None = None,
+                     fetch_k: int | None = None,
+                     rrf_k: int = 60,
+                     regulations: List[str] | None = None,
+                     jurisdictions: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Search several query variants at once and fuse them by reciprocal rank
+
+        All variants are embedded in one call and searched in one batched
+        Qdrant request; a point's fused score is sum(1 / (rrf_k + rank)).
+
+        Args:
+            queries:          Query variants (the original query first)
+            top_k:            Number of fused results to return
+            query_embeddings: Precomputed embeddings, one per query
+            fetch_k:          Hits per variant before fusion (defaults to 2 * top_k)
+            rrf_k:            RRF damping constant
+            regulations:      Restrict results to these regulations
+            jurisdictions:    Restrict results to these jurisdictions
+
+        Returns:
+            List of search results, scored by RRF
+        """
+        if query_embeddings is None:
+            query_embeddings = self.embedding_generator.embed_batch(batch=queries)
+
+        hit_lists = self._query(query_embeddings=query_embeddings,
+                                limit=fetch_k or 2 * top_k,
+                                regulations=regulations,
+                                jurisdictions=jurisdictions)
+
+        # Point IDs are per collection; chunk IDs identify a hit across shards
+        fused_scores: Dict[Any, float] = {}
+        points: Dict[Any, Any] = {}
+        for hits in hit_lists:
+            for rank, point in enumerate(hits, start=1):
+                key = point.payload["chunk_id"]
+                fused_scores[key] = fused_scores.get(key, 0.0) + 1.0 / (rrf_k + rank)
+                points.setdefault(key, point)
+
+        best_ids = sorted(fused_scores, key=fused_scores.get, reverse=True)[:top_k]
+        results = self._format_points([points[point_id] for point_id in best_ids])
+        for result, point_id in zip(results, best_ids):
+            result["score"] = fused_scores[point_id]
+
+        return results
+
+    def search_hierarchical(self,
+                            query: str,
+                            top_k: int = 5,
+                            query_embedding: List[float] | None = None,
+                            fetch_k: int | None = None,
+                            max_chars: int = 4000,
+                            window: int = 1,
+                            regulations: List[str] | None = None,
+                            jurisdictions: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Match on paragraphs, then return one expanded result per article
+
+        Paragraph hits are grouped by parent article so sibling paragraphs do
+        not crowd out other articles. Each group is expanded to the whole
+        article when it fits in ``max_chars``, otherwise to the matched
+        paragraphs plus ``window`` neighbours on each side.
+
+        Args:
+            query:           Query text
+            top_k:           Number of articles to return
+            query_embedding: Precomputed query embedding (skips the embedding call)
+            fetch_k:         Paragraph hits to group (defaults to 3 * top_k)
+            max_chars:       Size budget for each expanded result
+            window:          Neighbouring paragraphs to add around each match
+            regulations:     Restrict results to these regulations
+            jurisdictions:   Restrict results to these jurisdictions
+
+        Returns:
+            List of search results with scores, one per article
+        """
+        if self.article_index is None:
+            raise ValueError("search_hierarchical requires an article_index")
+
+        hits = self.search(query=query,
+                           top_k=fetch_k or 3 * top_k,
+                           query_embedding=query_embedding,
+                           regulations=regulations,
+                           jurisdictions=jurisdictions)
+
+        # Group by article, keeping the best-scoring article first
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for hit in hits:
+            if hit["chunk_id"] not in self.article_index.chunks:
+                # Index out of sync with the collection: keep the hit as is
+                groups.setdefault(hit["chunk_id"], []).append(hit)
+                continue
+            groups.setdefault(self.article_index.parent_of(hit["chunk_id"]), []).append(hit)
+
+        results = []
+        for parent_id, group in list(groups.items())[:top_k]:
+            matched_ids = [hit["chunk_id"] for hit in group]
+            if parent_id not in self.article_index.articles:
+                results.append(group[0])
+                continue
+
+            text = self.article_index.article_text(parent_id)
+            context = "article"
+            if len(text) > max_chars:
+                text = self._expand_neighbors(parent_id, matched_ids, max_chars, window)
+                context = "neighbors"
+
+            metadata = {k: v for k, v in group[0]["metadata"].items()
+                        if k not in ("paragraph", "prev_chunk_id", "next_chunk_id")}
+            results.append({
+                "chunk_id": parent_id,
+                "text": text,
+                "metadata": {**metadata, "context": context, "matched_chunk_ids": matched_ids},
+                "score": group[0]["score"],
+            })
+
+        return results
 
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection"""
 
-        if self.client.collection_exists(self.collection_name):
-            collection = self.client.get_collection(self.collection_name)
-            info = {
+        if self.sharded:
+            shards = {alias: self._get_single_collection_info(alias) for alias in self.refresh_shards()}
+            return {
                 "name": self.collection_name,
+                "shards": shards,
+                "points_count": sum(info.get("points_count") or 0 for info in shards.values()),
+            }
+
+        return self._get_single_collection_info(self.collection_name)
+
+    def _get_single_collection_info(self, collection_name: str) -> Dict[str, Any]:
+        if self._collection_exists(collection_name):
+            collection = self.client.get_collection(collection_name)
+            info = {
+                "name": collection_name,
+                "collection": self._alias_targets().get(collection_name, collection_name),
                 "vectors_count": collection.indexed_vectors_count,
                 "points_count": collection.points_count,
                 "status": collection.status
@@ -129,3 +463,238 @@ class VectorDatabase:
             info = {"error": "Collection not found"}
 
         return info
+
+    def _create_collection(self,
+                           collection_name: str,
+                           vector_size: int,
+                           metadata: Dict[str, Any] | None = None):
+        if self.client.collection_exists(collection_name):
+            print(f"✅ Collection '{collection_name}' already exists")
+            return
+
+        # Create new collection
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=vector_size,
+                distance=Distance.COSINE
+            ),
+            metadata=metadata,
+        )
+        print(f"✅ Created collection '{collection_name}'")
+
+        if self.chunk_store is not None:
+            # Slim payloads keep filterable fields at the top level
+            for field_name in self.FILTERABLE_FIELDS:
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType.KEYWORD,
+                )
+
+    def _query(self,
+               query_embeddings: List[List[float]],
+               limit: int,
+               regulations: List[str] | None = None,
+               jurisdictions: List[str] | None = None) -> List[List[ScoredPoint]]:
+        """
+        Run one batched query per target collection and merge hits by score
+
+        Returns:
+            One hit list per query embedding, best first
+        """
+        if self.sharded:
+            # Shards are picked by regulation and recorded jurisdictions; jurisdictions
+            # are still filtered on the payload, exactly as in the single-collection layout
+            collections = self._select_shards(regulations, jurisdictions)
+            query_filter = self._build_filter(None, jurisdictions)
+        else:
+            collections = [self.collection_name]
+            query_filter = self._build_filter(regulations, jurisdictions)
+
+        if not collections:
+            return [[] for _ in query_embeddings]
+
+        requests = [
+            QueryRequest(
+                query = embedding,
+                filter = query_filter,
+                limit = limit,
+                # Slim mode: only the key checked against the local chunk store
+                with_payload = True if self.chunk_store is None else ["chunk_id", "index_version"],
+                ) for embedding in query_embeddings
+        ]
+
+        def query_collection(collection_name: str) -> List[List[ScoredPoint]]:
+            responses = self.client.query_batch_points(collection_name=collection_name, requests=requests)
+            return [response.points for response in responses]
+
+        if len(collections) == 1:
+            return query_collection(collections[0])
+
+        # Fan out to the shards concurrently; cosine scores are comparable across them
+        per_shard = list(self._executor.map(query_collection, collections))
+        return [
+            sorted((point for shard in per_shard for point in shard[i]), key=lambda p: p.score, reverse=True)[:limit]
+            for i in range(len(query_embeddings))
+        ]
+
+    def _select_shards(self, regulations: List[str] | None, jurisdictions: List[str] | None = None) -> List[str]:
+        """
+        Shard aliases that can hold matches for the filters (all shards when None)
+
+        Shards whose recorded jurisdictions miss every wanted one are skipped;
+        shards rebuilt before jurisdictions were recorded are always queried.
+        """
+        checked_at = self._shards_checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.index_version_ttl:
+            self.refresh_shards()
+
+        wanted_regulations = set(self.normalise_filter(regulations)) if regulations else None
+        wanted_jurisdictions = set(self.normalise_filter(jurisdictions)) if jurisdictions else None
+
+        selected = []
+        for alias, regulation in self.shards.items():
+            if wanted_regulations is not None and regulation not in wanted_regulations:
+                continue
+            held = self.shard_jurisdictions.get(alias)
+            if wanted_jurisdictions is not None and held is not None and wanted_jurisdictions.isdisjoint(held):
+                continue
+            selected.append(alias)
+        return selected
+
+    def _build_filter(self, regulations: List[str] | None, jurisdictions: List[str] | None) -> Filter | None:
+        """Payload filter on regulation / jurisdiction"""
+        prefix = "" if self.chunk_store is not None else "metadata."
+        conditions = []
+        if regulations:
+            conditions.append(FieldCondition(key=f"{prefix}regulation",
+                                             match=MatchAny(any=self.normalise_filter(regulations))))
+        if jurisdictions:
+            conditions.append(FieldCondition(key=f"{prefix}jurisdiction",
+                                             match=MatchAny(any=self.normalise_filter(jurisdictions))))
+        return Filter(must=conditions) if conditions else None
+
+    def _shard_alias(self, regulation: str) -> str:
+        return f"{self.collection_name}_{regulation.lower()}"
+
+    @staticmethod
+    def _new_collection_name(alias: str) -> str:
+        # Timestamp for readability, random suffix so two rebuilds in the same second never collide
+        return f"{alias}_{time.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+    def _swap_alias(self, alias: str, new_collection: str):
+        """Point ``alias`` at ``new_collection`` in one alias update and drop the collection it replaced"""
+        old_collection = self._alias_targets().get(alias)
+
+        if old_collection is None and self.client.collection_exists(alias):
+            # Index built before aliases were used: a physical collection holds the
+            # name, and Qdrant refuses an alias that shadows it
+            print(f"⚠️ Replacing legacy collection '{alias}' with an alias")
+            self.client.delete_collection(collection_name=alias)
+
+        operations = []
+        if old_collection is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+        operations.append(CreateAliasOperation(create_alias=CreateAlias(collection_name=new_collection, alias_name=alias)))
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        print(f"✅ '{alias}' now serves '{new_collection}'")
+
+        if old_collection is not None:
+            self.client.delete_collection(collection_name=old_collection)
+
+    def _alias_targets(self) -> Dict[str, str]:
+        """alias name -> physical collection name"""
+        return {alias.alias_name: alias.collection_name for alias in self.client.get_aliases().aliases}
+
+    def _collection_exists(self, name: str) -> bool:
+        """True for a physical collection or an alias of one"""
+        return name in self._alias_targets() or self.client.collection_exists(name)
+
+    @staticmethod
+    def _combine_versions(shard_versions: Dict[str, str]) -> str:
+        digest = hashlib.sha256()
+        for alias, version in sorted(shard_versions.items()):
+            digest.update(f"{alias}={version};".encode())
+        return digest.hexdigest()[:16]
+
+    def _build_payload(self,
+                       chunk: Chunk,
+                       index_version: str | None = None,
+                       parser_fingerprint: str | None = None) -> Dict[str, Any]:
+        """Full payload, or only the filterable fields when a chunk store holds the rest"""
+        provenance = {"index_version": index_version, "parser_fingerprint": parser_fingerprint}
+        if self.chunk_store is None:
+            return {
+                "chunk_id": chunk.id,
+                "text": chunk.text,
+                "metadata": chunk.metadata,
+                **provenance,
+            }
+        return {
+            **{k: chunk.metadata[k] for k in self.FILTERABLE_FIELDS if k in chunk.metadata},
+            # chunk_id + index_version key the local store entry and are checked on every read
+            "chunk_id": chunk.id,
+            **provenance,
+        }
+
+    def _read_stored_version(self, collection_name: str) -> str | None:
+        """index_version recorded in the payload of any point of the collection (or alias)"""
+        records, _ = self.client.scroll(collection_name=collection_name,
+                                        limit=1,
+                                        with_payload=["index_version"],
+                                        with_vectors=False)
+        return records[0].payload.get("index_version") if records else None
+
+    def _format_points(self, points: List[Any]) -> List[Dict[str, Any]]:
+        """Turn Qdrant points into result dicts, resolving text locally in slim mode"""
+        formatted_results = []
+        for point in points:
+            record = point.payload if self.chunk_store is None else self._resolve_slim(point)
+            formatted_results.append({
+                "chunk_id": record["chunk_id"],
+                "text": record["text"],
+                "metadata": record["metadata"],
+                "score": getattr(point, "score", None),
+            })
+        return formatted_results
+
+    def _resolve_slim(self, point: Any) -> Dict[str, Any]:
+        """Chunk store record of a slim point, checked against the key in its payload"""
+        chunk_id = point.payload.get("chunk_id")
+        index_version = point.payload.get("index_version")
+        if chunk_id is None or index_version is None:
+            raise RuntimeError(f"Point {point.id} has no chunk store key, re-index the collection")
+
+        record = self.chunk_store.get(point.id, version=index_version)
+        if record["chunk_id"] != chunk_id:
+            raise RuntimeError(f"Chunk store version '{index_version}' holds '{record['chunk_id']}' "
+                               f"at point {point.id}, expected '{chunk_id}'")
+        return record
+
+    def _expand_neighbors(self,
+                          parent_id: str,
+                          matched_ids: List[str],
+                          max_chars: int,
+                          window: int) -> str:
+        """Matched paragraphs first, then their neighbours, until the budget is spent"""
+        selected = list(matched_ids)
+        candidates = [n for cid in matched_ids for n in self.article_index.neighbors(cid, window)]
+
+        for chunk_id in candidates:
+            if chunk_id in selected:
+                continue
+            expanded = self.article_index.article_text(parent_id, selected + [chunk_id])
+            if len(expanded) > max_chars:
+                break
+            selected.append(chunk_id)
+
+        return self.article_index.article_text(parent_id, selected)
+
+    def _fingerprint_chunks(self, chunks: List[Chunk]) -> str:
+        """Content hash of the indexed chunks and the embedding model"""
+        digest = hashlib.sha256(self.embedding_generator.model.encode())
+        for chunk in chunks:
+            digest.update(chunk.id.encode())
+            digest.update(chunk.text.encode())
+        return digest.hexdigest()[:16]
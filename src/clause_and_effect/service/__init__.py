@@ -0,0 +1,7 @@
+from .compliance_service import ComplianceService, ServiceClosedError, ServiceOverloadedError
+
+__all__ = [
+    'ComplianceService',
+    'ServiceClosedError',
+    'ServiceOverloadedError',
+]
@@ -0,0 +1,175 @@
+"""
+Long-lived service layer around ComplianceAgent
+
+Keeps one warm agent (and therefore one set of pooled OpenAI, Qdrant and
+LLM clients) per process, coalesces identical in-flight questions into a
+single upstream execution and applies bounded admission with backpressure.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+import copy
+import re
+import threading
+
+from src.clause_and_effect.agents import ComplianceAgent
+from src.clause_and_effect.retrieval import VectorDatabase
+
+
+class ServiceOverloadedError(RuntimeError):
+    """Raised when the admission queue is full and a request cannot be accepted"""
+
+
+class ServiceClosedError(RuntimeError):
+    """Raised for requests submitted after the service was closed"""
+
+
+class ComplianceService:
+    """Thread-safe, single-flight front end for a shared ComplianceAgent"""
+
+    def __init__(self,
+                 agent: ComplianceAgent,
+                 max_workers: int = 8,
+                 max_pending: int = 64,
+                 admission_timeout: float = 0.0):
+        """
+        Args:
+            agent:             Warm agent whose clients are shared by every request
+            max_workers:       Upstream executions running concurrently
+            max_pending:       Distinct executions admitted (running + queued)
+            admission_timeout: Seconds to wait for a free slot before rejecting
+        """
+        self.agent = agent
+        self.admission_timeout = admission_timeout
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="compliance")
+        self._admission = threading.BoundedSemaphore(max_pending)
+        self._in_flight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"executed": 0, "coalesced": 0, "rejected": 0}
+        self._closed = False
+
+    def warm_up(self) -> Dict[str, Any]:
+        """Open upstream connections before the first real request"""
+        self.agent.vector_db.embedding_generator.embed_text("warm-up")
+        return self.agent.get_system_info()
+
+    def ask(self,
+            query: str,
+            top_k: int = 3,
+            regulations: List[str] | None = None,
+            jurisdictions: List[str] | None = None,
+            timeout: float | None = None) -> Dict[str, Any]:
+        """
+        Ask a compliance question, sharing the upstream call with identical in-flight requests
+
+        Args:
+            query:         User's question
+            top_k:         Number of chunks to retrieve
+            regulations:   Only retrieve from these regulations (e.g. ["GDPR"])
+            jurisdictions: Only retrieve from these jurisdictions (e.g. ["EU"])
+            timeout:       Seconds to wait for the answer (None waits forever)
+
+        Returns:
+            Agent response dict (a private copy per caller), plus a "coalesced" flag
+
+        Raises:
+            ServiceOverloadedError: If the admission queue is full
+            ServiceClosedError: If the service has been closed
+        """
+        future, coalesced = self._submit(query=query,
+                                         top_k=top_k,
+                                         regulations=regulations,
+                                         jurisdictions=jurisdictions)
+        # Coalesced callers share one result object; never hand out its nested lists/dicts
+        return {**copy.deepcopy(future.result(timeout=timeout)), "coalesced": coalesced}
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for executed, coalesced and rejected requests"""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._in_flight)}
+
+    def close(self):
+        """Reject new requests, wait for running ones and release the worker threads"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------ #
+    #  Private helpers                                                     #
+    # ------------------------------------------------------------------ #
+
+    def _submit(self,
+                query: str,
+                top_k: int,
+                regulations: List[str] | None,
+                jurisdictions: List[str] | None) -> Tuple[Future, bool]:
+        # Only requests with the same filters may share an answer
+        key = (
+            self._normalise_query(query),
+            top_k,
+            tuple(VectorDatabase.normalise_filter(regulations)) if regulations else None,
+            tuple(VectorDatabase.normalise_filter(jurisdictions)) if jurisdictions else None,
+        )
+
+        with self._lock:
+            if self._closed:
+                raise ServiceClosedError("ComplianceService is closed")
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, True
+
+        # Backpressure: wait (bounded) for a slot outside the lock
+        if self.admission_timeout > 0:
+            admitted = self._admission.acquire(timeout=self.admission_timeout)
+        else:
+            admitted = self._admission.acquire(blocking=False)
+
+        if not admitted:
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise ServiceOverloadedError("Too many pending compliance requests, retry later")
+
+        with self._lock:
+            if self._closed:
+                self._admission.release()
+                raise ServiceClosedError("ComplianceService is closed")
+
+            # Another thread may have started the same request while we waited
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._admission.release()
+                self._stats["coalesced"] += 1
+                return future, True
+
+            try:
+                future = self._executor.submit(self.agent.ask,
+                                               query=query,
+                                               top_k=top_k,
+                                               regulations=regulations,
+                                               jurisdictions=jurisdictions)
+            except BaseException:
+                # No done-callback will ever give the slot back
+                self._admission.release()
+                raise
+            self._in_flight[key] = future
+            self._stats["executed"] += 1
+
+        future.add_done_callback(lambda _: self._on_done(key))
+        return future, False
+
+    def _on_done(self, key: Tuple):
+        with self._lock:
+            self._in_flight.pop(key, None)
+        self._admission.release()
+
+    @staticmethod
+    def _normalise_query(query: str) -> str:
+        """Case, whitespace and trailing punctuation do not change a question"""
+        return re.sub(r"\s+", " ", query).strip().rstrip("?!. ").casefold()
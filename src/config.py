@@ -28,6 +28,30 @@ class Settings(BaseSettings):
     QDRANT_URL: SecretStr = ""
     QDRANT_PORT: int = 6333
     VECTOR_DB_COLLECTION_NAME: str = "compliance_docs"
+    VECTOR_DB_SLIM_PAYLOADS: bool = False  # keep chunk text in a local store instead of Qdrant
+    VECTOR_DB_SHARDED: bool = False  # one collection (alias) per regulation, queried in parallel
+
+    # Ingestion
+    DEDUP_THRESHOLD: float = 0.9  # Jaccard similarity above which chunks are collapsed
+
+    # Retrieval
+    RETRIEVAL_MODE: str = "flat"  # "flat", "hierarchical" or "multi_query"
+    HIERARCHICAL_MAX_CHARS: int = 4000
+    QUERY_EXPANSION_LLM: bool = False  # multi_query: add LLM rewrites to the synonym table
+    MULTI_QUERY_VARIANTS: int = 4
+    QUERY_ROUTING: bool = True  # route by complexity: article lookup / language model / reasoning model
+
+    # Semantic answer cache
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_SIZE: int = 1024
+
+    # Evaluation
+    EVAL_MAX_WORKERS: int = 8
+
+    # Agent service
+    SERVICE_MAX_WORKERS: int = 8
+    SERVICE_MAX_PENDING: int = 64
+    SERVICE_ADMISSION_TIMEOUT: float = 0.0
 
     # Paths
     INPUT_FOLDER: Path = os.path.join(ENV_FILE_DIR, 'input')
@@ -35,7 +59,10 @@ class Settings(BaseSettings):
     DATA_DIR: Path = os.path.join(ENV_FILE_DIR, 'data')
     REGULATIONS_DIR: Path = os.path.join(DATA_DIR, 'regulations')
     CHUNKS_DIR: Path = os.path.join(DATA_DIR, 'chunks')
+    CHUNK_STORE_DIR: Path = os.path.join(CHUNKS_DIR, 'store')
+    ARTICLE_INDEX_PATH: Path = os.path.join(CHUNKS_DIR, 'article_index.json')
     TEST_CASES_DIR: Path = os.path.join(DATA_DIR, 'test_cases')
+    SNAPSHOTS_DIR: Path = os.path.join(DATA_DIR, 'snapshots')
 
     class Config:
         case_sensitive = True
@@ -5,7 +5,7 @@ import time
 from uuid import uuid4
 
 from src.config import get_settings, get_llm_config
-from src.clause_and_effect import ComplianceAgent
+from src.clause_and_effect import ComplianceAgent, ComplianceService
 
 
 def main():
@@ -27,10 +27,26 @@ def main():
         vector_db_api_key = settings.QDRANT_API_KEY,
         collection_name = settings.VECTOR_DB_COLLECTION_NAME,
         embedding_model = settings.EMBEDDING_MODEL,
-        embedding_model_api_key = settings.OPENAI_API_KEY
+        embedding_model_api_key = settings.OPENAI_API_KEY,
+        semantic_cache_threshold = settings.SEMANTIC_CACHE_THRESHOLD,
+        semantic_cache_size = settings.SEMANTIC_CACHE_SIZE,
+        chunk_store_dir = settings.CHUNK_STORE_DIR if settings.VECTOR_DB_SLIM_PAYLOADS else None,
+        article_index_path = settings.ARTICLE_INDEX_PATH if os.path.exists(settings.ARTICLE_INDEX_PATH) else None,
+        retrieval_mode = settings.RETRIEVAL_MODE,
+        hierarchical_max_chars = settings.HIERARCHICAL_MAX_CHARS,
+        enable_routing = settings.QUERY_ROUTING,
+        query_expansion_llm = settings.QUERY_EXPANSION_LLM,
+        multi_query_variants = settings.MULTI_QUERY_VARIANTS,
+        sharded = settings.VECTOR_DB_SHARDED,
     )
 
-    response = compliance_agent.ask(query=query)
+    # One warm agent behind the admission-controlled, single-flight service
+    with ComplianceService(agent=compliance_agent,
+                           max_workers=settings.SERVICE_MAX_WORKERS,
+                           max_pending=settings.SERVICE_MAX_PENDING,
+                           admission_timeout=settings.SERVICE_ADMISSION_TIMEOUT) as service:
+        service.warm_up()
+        response = service.ask(query=query)
 
 
 
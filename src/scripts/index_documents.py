@@ -1,13 +1,28 @@
 """
 Index regulation documents into vector database
+
+Commands:
+    index   Parse, embed and index GDPR (default when no command is given)
+    export  Write the indexed collection to a portable snapshot bundle
+    import  Restore a snapshot bundle without parsing or embedding
 """
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
 
 from src.config import get_settings
-from src.clause_and_effect import GDPRParser, VectorDatabase
+from src.clause_and_effect import (ArticleIndex, Chunk, ChunkStore, GDPRParser, IngestionProfiler,
+                                   NearDuplicateDetector, SnapshotBundle, VectorDatabase)
+from src.clause_and_effect.profiling import profile_stage
 
 
-def main():
-    """Index GDPR into vector database"""
+app = typer.Typer(help="Clause & Effect document indexing")
+
+
+def _print_banner():
     print("""
     ╔═══════════════════════════════════════════╗
     ║                                           ║
@@ -17,6 +32,35 @@ def main():
     ╚═══════════════════════════════════════════╝
     """)
 
+
+def _get_vector_db(article_index: ArticleIndex | None = None) -> VectorDatabase:
+    settings = get_settings()
+    return VectorDatabase(
+        vector_db_url=settings.QDRANT_URL,
+        vector_db_port=settings.QDRANT_PORT,
+        vector_db_api_key=settings.QDRANT_API_KEY,
+        collection_name=settings.VECTOR_DB_COLLECTION_NAME,
+        embedding_model=settings.EMBEDDING_MODEL,
+        embedding_model_api_key=settings.OPENAI_API_KEY,
+        chunk_store=ChunkStore(settings.CHUNK_STORE_DIR) if settings.VECTOR_DB_SLIM_PAYLOADS else None,
+        article_index=article_index,
+        sharded=settings.VECTOR_DB_SHARDED,
+    )
+
+
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    """Clause & Effect document indexing; runs ``index`` when no command is given"""
+    if ctx.invoked_subcommand is None:
+        index(profile=False, dedup=True)
+
+
+@app.command()
+def index(profile: bool = typer.Option(False, help="Write a per-stage timing and memory report to OUT_FOLDER"),
+          dedup: bool = typer.Option(True, help="Collapse near-duplicate chunks before embedding")):
+    """Index GDPR into vector database"""
+    _print_banner()
+
     settings = get_settings()
 
     gdpr_path = settings.REGULATIONS_DIR / "gdpr.pdf"
@@ -31,27 +75,40 @@ def main():
     print(f"✅ Found GDPR at: {gdpr_path}")
     print()
 
+    profiler = IngestionProfiler() if profile else None
+
     # Parse GDPR
     parser = GDPRParser()
-    chunks = parser.parse(gdpr_path)
+    chunks = parser.parse(gdpr_path, profiler=profiler)
+
+    # Article -> paragraph adjacency for hierarchical retrieval (built before
+    # deduplication, so every article stays addressable)
+    article_chunks = list(chunks)
 
     # Statistics
     print(f"\n📊 Statistics:")
     print(f"   Total chunks: {len(chunks)}")
 
+    if dedup:
+        with profile_stage(profiler, "deduplicate", items=len(chunks)):
+            chunks, dedup_report = NearDuplicateDetector(threshold=settings.DEDUP_THRESHOLD).deduplicate(chunks)
+
+        report_path = Path(settings.OUT_FOLDER) / "dedup_report.json"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(dedup_report.to_dict(), indent=2), encoding="utf-8")
+        print(f"   Chunks after deduplication: {len(chunks)} (report: {report_path})")
+
     # Initialize vector DB
-    vector_db = VectorDatabase(
-        vector_db_url=settings.QDRANT_URL,
-        vector_db_port=settings.QDRANT_PORT,
-        vector_db_api_key=settings.QDRANT_API_KEY,
-        collection_name=settings.VECTOR_DB_COLLECTION_NAME,
-        embedding_model=settings.EMBEDDING_MODEL,
-        embedding_model_api_key=settings.OPENAI_API_KEY
-    )
-    vector_db.create_collection()
+    vector_db = _get_vector_db()
 
     # Index chunks
-    vector_db.index_chunks(chunks)
+    vector_db.index_chunks(chunks, profiler=profiler, parser_fingerprint=parser.fingerprint())
+
+    # Tagged with the collection it was built alongside, so export can tell a stale index apart
+    ArticleIndex(article_chunks, index_version=vector_db.index_version).save(settings.ARTICLE_INDEX_PATH)
+
+    if profiler is not None:
+        profiler.write(Path(settings.OUT_FOLDER) / f"ingestion_profile_{time.strftime('%Y%m%d_%H%M%S')}.json")
 
     # Test search
     query = "What is the timeline for data deletion requests?"
@@ -66,5 +123,51 @@ def main():
         print(f"   Text: {result['text'][:150]}...")
 
 
+@app.command()
+def export(bundle_dir: Optional[Path] = typer.Argument(None, help="Output directory (default: SNAPSHOTS_DIR/<collection>)")):
+    """Export the indexed collection to a snapshot bundle"""
+    _print_banner()
+
+    settings = get_settings()
+    bundle_dir = bundle_dir or Path(settings.SNAPSHOTS_DIR) / settings.VECTOR_DB_COLLECTION_NAME
+
+    # The article index is built from the pre-deduplication chunks, so it
+    # travels with the bundle instead of being rebuilt from the indexed ones
+    article_index = None
+    if Path(settings.ARTICLE_INDEX_PATH).exists():
+        article_index = ArticleIndex.load(settings.ARTICLE_INDEX_PATH)
+    else:
+        print(f"⚠️  No article index at {settings.ARTICLE_INDEX_PATH}, exporting without one")
+
+    SnapshotBundle.export(vector_db=_get_vector_db(article_index=article_index), bundle_dir=bundle_dir)
+
+
+@app.command("import")
+def import_bundle(bundle_dir: Optional[Path] = typer.Argument(None, help="Bundle directory (default: SNAPSHOTS_DIR/<collection>)"),
+                  parallel: int = typer.Option(4, help="Parallel upload workers")):
+    """Restore a snapshot bundle into the vector database"""
+    _print_banner()
+
+    settings = get_settings()
+    bundle = SnapshotBundle(bundle_dir or Path(settings.SNAPSHOTS_DIR) / settings.VECTOR_DB_COLLECTION_NAME)
+
+    expected_parser = GDPRParser().fingerprint()
+    if bundle.manifest["parser_fingerprint"] is None:
+        print(f"⚠️  Bundle does not record its parser, current parser is {expected_parser}")
+    elif bundle.manifest["parser_fingerprint"] != expected_parser:
+        print(f"⚠️  Bundle was parsed with {bundle.manifest['parser_fingerprint']}, current parser is {expected_parser}")
+
+    bundle.load_into(vector_db=_get_vector_db(), parallel=parallel)
+
+    article_index = bundle.article_index
+    if article_index is None:
+        # Older bundles: rebuild from the indexed chunks, which lacks any collapsed duplicates
+        print("⚠️  Bundle has no article index, rebuilding it from the deduplicated chunks")
+        article_index = ArticleIndex([Chunk(id=c["chunk_id"], text=c["text"], metadata=c["metadata"])
+                                      for c in bundle.chunks],
+                                     index_version=bundle.manifest["index_version"])
+    article_index.save(settings.ARTICLE_INDEX_PATH)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    app()
@@ -0,0 +1,73 @@
+"""
+Run the evaluation suite in TEST_CASES_DIR against the current index
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from src.config import get_settings, get_llm_config
+from src.clause_and_effect import ComplianceAgent
+from src.clause_and_effect.evaluation import EvaluationRunner
+
+
+def main(max_workers: Optional[int] = typer.Option(None, help="Test cases evaluated concurrently (default: EVAL_MAX_WORKERS)"),
+         top_k: int = typer.Option(5, help="Retrieval depth; recall is reported at this k"),
+         limit: Optional[int] = typer.Option(None, help="Only run the first N test cases")):
+    """Evaluate retrieval and citation quality over TEST_CASES_DIR"""
+    settings = get_settings()
+
+    agent = ComplianceAgent(
+        llm_config = get_llm_config(),
+        vector_db_url = settings.QDRANT_URL,
+        vector_db_port = settings.QDRANT_PORT,
+        vector_db_api_key = settings.QDRANT_API_KEY,
+        collection_name = settings.VECTOR_DB_COLLECTION_NAME,
+        embedding_model = settings.EMBEDDING_MODEL,
+        embedding_model_api_key = settings.OPENAI_API_KEY,
+        chunk_store_dir = settings.CHUNK_STORE_DIR if settings.VECTOR_DB_SLIM_PAYLOADS else None,
+        article_index_path = settings.ARTICLE_INDEX_PATH if os.path.exists(settings.ARTICLE_INDEX_PATH) else None,
+        retrieval_mode = settings.RETRIEVAL_MODE,
+        hierarchical_max_chars = settings.HIERARCHICAL_MAX_CHARS,
+        enable_routing = settings.QUERY_ROUTING,
+        query_expansion_llm = settings.QUERY_EXPANSION_LLM,
+        multi_query_variants = settings.MULTI_QUERY_VARIANTS,
+        sharded = settings.VECTOR_DB_SHARDED,
+    )
+
+    runner = EvaluationRunner(agent=agent,
+                              cache_dir=Path(settings.OUT_FOLDER) / "eval_cache",
+                              max_workers=max_workers or settings.EVAL_MAX_WORKERS,
+                              top_k=top_k)
+
+    cases = runner.load_test_cases(settings.TEST_CASES_DIR)
+    report = runner.run(cases[:limit] if limit else cases)
+
+    report_path = Path(settings.OUT_FOLDER) / f"evaluation_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+
+    summary = report["summary"]
+    table = Table(title=f"Evaluation ({summary['cases']} cases, index {report['index_version']})")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    for metric in ("recall_at_k", "mrr", "citation_precision", "citation_recall", "citation_f1",
+                   "latency_p50", "latency_p95"):
+        value = summary[metric]
+        table.add_row(metric, f"{value:.3f}" if value is not None else "n/a")
+    table.add_row("failed cases", str(summary["errors"]))
+    table.add_row("retrieval cache hits", str(summary["retrieval_cache_hits"]))
+    table.add_row("generation cache hits", str(summary["generation_cache_hits"]))
+    table.add_row("wall time (s)", f"{report['wall_time']:.1f}")
+    Console().print(table)
+
+    print(f"✅ Report written to {report_path}")
+
+
+if __name__ == "__main__":
+    typer.run(main)